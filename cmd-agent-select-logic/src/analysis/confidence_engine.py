@@ -1,8 +1,7 @@
 # src/analysis/confidence_engine.py
 import time
-import hashlib
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from collections import OrderedDict
 import threading
 
@@ -14,14 +13,20 @@ class ConfidenceComponents:
     context_completeness: float
     resource_availability: float
     total_confidence: float
+    cache_hit: bool = False
 
 @dataclass
 class CacheEntry:
     """Cache entry with TTL for all cache layers"""
+    # One entry per key per layer is retained, so drop the per-instance __dict__
+    # (dataclass(slots=True) needs Python 3.10; slots rule out field defaults, so
+    # every put passes its layer explicitly)
+    __slots__ = ('confidence', 'timestamp', 'access_count', 'layer')
+    
     confidence: ConfidenceComponents
     timestamp: float
     access_count: int
-    layer: str = "L1"  # Track which layer this came from
+    layer: str  # Track which layer this came from
 
 @dataclass
 class AdaptiveWeights:
@@ -126,16 +131,17 @@ class L1ConfidenceCache:
         }
     
     def _generate_key(self, task_description: str, domain_analysis: Dict, 
-                      available_agents: List[str]) -> str:
+                      available_agents: List[str]) -> Tuple[str, int, int]:
         """Generate cache key from inputs"""
-        key_data = f"{task_description}:{len(domain_analysis.get('domains', []))}:{len(available_agents)}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        # The dicts hash the tuple directly (string hashes are cached per object),
+        # so no digest is computed per lookup
+        return (task_description, len(domain_analysis.get('domains', [])), len(available_agents))
     
     def _is_expired(self, timestamp: float, ttl_seconds: int) -> bool:
         """Check if cache entry is expired"""
         return time.time() - timestamp > ttl_seconds
     
-    def _l1_get(self, key: str) -> Optional[ConfidenceComponents]:
+    def _l1_get(self, key: Tuple[str, int, int]) -> Optional[ConfidenceComponents]:
         """Get from L1 cache (existing logic preserved)"""
         current_time = time.time()
         
@@ -156,7 +162,7 @@ class L1ConfidenceCache:
         
         return None
     
-    def _l2_get(self, key: str) -> Optional[ConfidenceComponents]:
+    def _l2_get(self, key: Tuple[str, int, int]) -> Optional[ConfidenceComponents]:
         """Get from L2 pattern cache (Cache-Aside pattern)"""
         current_time = time.time()
         
@@ -177,7 +183,7 @@ class L1ConfidenceCache:
         
         return None
     
-    def _l3_get(self, key: str) -> Optional[ConfidenceComponents]:
+    def _l3_get(self, key: Tuple[str, int, int]) -> Optional[ConfidenceComponents]:
         """Get from L3 recent cache"""
         current_time = time.time()
         
@@ -198,7 +204,7 @@ class L1ConfidenceCache:
         
         return None
     
-    def _l1_put(self, key: str, confidence: ConfidenceComponents):
+    def _l1_put(self, key: Tuple[str, int, int], confidence: ConfidenceComponents):
         """Put into L1 cache (existing logic preserved)"""
         current_time = time.time()
         
@@ -214,7 +220,7 @@ class L1ConfidenceCache:
             layer="L1"
         )
     
-    def _l2_put(self, key: str, confidence: ConfidenceComponents):
+    def _l2_put(self, key: Tuple[str, int, int], confidence: ConfidenceComponents):
         """Put into L2 pattern cache"""
         current_time = time.time()
         
@@ -230,7 +236,7 @@ class L1ConfidenceCache:
             layer="L2"
         )
     
-    def _l3_put(self, key: str, confidence: ConfidenceComponents):
+    def _l3_put(self, key: Tuple[str, int, int], confidence: ConfidenceComponents):
         """Put into L3 recent cache"""
         current_time = time.time()
         
@@ -378,12 +384,19 @@ class ConfidenceEngine:
         }
     
     def calculate_pattern_confidence(self, task_description: str, 
-                                   available_agents: List[str]) -> float:
-        """Calculate pattern matching confidence (adaptive weight)"""
+                                   available_agents: List[str],
+                                   task_tokens: Optional[List[str]] = None) -> float:
+        """Calculate pattern matching confidence (adaptive weight)
+        
+        task_tokens is the lowercased, whitespace-split description when the
+        caller has already computed it.
+        """
         
         # Simplified pattern matching - in production this would use
         # sophisticated NLP and pattern matching algorithms
-        task_tokens = set(task_description.lower().split())
+        if task_tokens is None:
+            task_tokens = task_description.lower().split()
+        task_tokens = set(task_tokens)
         
         max_confidence = 0.0
         for agent in available_agents:
@@ -455,10 +468,13 @@ class ConfidenceEngine:
         
         return agent_keywords.get(agent_name, set())
     
-    def _estimate_tokens(self, task_description: str, domain_count: int) -> int:
+    def _estimate_tokens(self, task_description: str, domain_count: int,
+                         word_count: Optional[int] = None) -> int:
         """Estimate token requirements for task"""
         
-        base_tokens = len(task_description.split()) * 1.3  # Rough token estimation
+        if word_count is None:
+            word_count = len(task_description.split())
+        base_tokens = word_count * 1.3  # Rough token estimation
         complexity_multiplier = 1 + (domain_count * 0.5)
         
         return int(base_tokens * complexity_multiplier * 200)  # Conservative estimate
@@ -476,18 +492,28 @@ class ConfidenceEngine:
             self.performance_stats['cache_hits'] += 1
             return cached_confidence
         
+        # Tokenize once for every component, reusing the detector's lowercased text
+        # (lowercasing never changes whitespace, so word counts are unaffected)
+        task_lower = domain_analysis.get('task_lower')
+        if task_lower is None:
+            task_lower = task_description.lower()
+        task_tokens = task_lower.split()
+        word_count = len(task_tokens)
+        
         # Calculate individual components
-        pattern_confidence = self.calculate_pattern_confidence(task_description, available_agents)
+        pattern_confidence = self.calculate_pattern_confidence(task_description, available_agents,
+                                                               task_tokens)
         
         # Create task signature for historical lookup
-        task_signature = f"{len(task_description.split())}:{domain_analysis.get('domain_count', 0)}"
+        task_signature = f"{word_count}:{domain_analysis.get('domain_count', 0)}"
         historical_confidence = self.calculate_historical_confidence(task_signature)
         
         context_confidence = self.calculate_context_confidence(domain_analysis)
         
         estimated_tokens = self._estimate_tokens(
             task_description, 
-            domain_analysis.get('domain_count', 0)
+            domain_analysis.get('domain_count', 0),
+            word_count
         )
         resource_confidence = self.calculate_resource_confidence(estimated_tokens)
         
@@ -507,8 +533,10 @@ class ConfidenceEngine:
             total_confidence=total_confidence
         )
         
-        # Store in 3-layer cache using Write-Through pattern
-        self.cache.put(task_description, domain_analysis, available_agents, confidence_components)
+        # Store in 3-layer cache using Write-Through pattern (cached copy is
+        # pre-flagged so hits can be returned without further allocation)
+        self.cache.put(task_description, domain_analysis, available_agents,
+                       replace(confidence_components, cache_hit=True))
         
         # Update performance stats
         calc_time_ms = (time.perf_counter() - start_time) * 1000
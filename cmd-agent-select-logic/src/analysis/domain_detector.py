@@ -1,7 +1,7 @@
 # src/analysis/domain_detector.py
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Optional
 import re
 
 class DomainProcessor(ABC):
@@ -11,9 +11,32 @@ class DomainProcessor(ABC):
         self.preferred_agents = preferred_agents
         
     @abstractmethod
-    def analyze(self, task_description: str) -> float:
-        """Return confidence score for domain detection (0.0-1.0)"""
+    def analyze(self, task_description: str, tokens: Optional[List[str]] = None) -> float:
+        """Return confidence score for domain detection (0.0-1.0)
+        
+        tokens is the lowercased, whitespace-split description when the caller
+        has already computed it; processors tokenize themselves otherwise.
+        """
         pass
+    
+    def _index_keywords(self):
+        """Map each keyword to the position of its category in self.keywords"""
+        self._keyword_category = {}
+        for category, keywords in enumerate(self.keywords.values()):
+            for keyword in keywords:
+                # Single-pass counting relies on each keyword belonging to one category
+                assert keyword not in self._keyword_category
+                self._keyword_category[keyword] = category
+    
+    def _count_keyword_matches(self, tokens: List[str]) -> List[int]:
+        """Count token matches for every keyword category in one pass over tokens"""
+        keyword_category = self._keyword_category
+        counts = [0] * len(self.keywords)
+        for token in tokens:
+            category = keyword_category.get(token)
+            if category is not None:
+                counts[category] += 1
+        return counts
 
 class FrontendDomainProcessor(DomainProcessor):
     def __init__(self):
@@ -27,20 +50,20 @@ class FrontendDomainProcessor(DomainProcessor):
             'secondary': ['css', 'responsive', 'styling', 'layout', 'design', 'interface'],
             'frameworks': ['nextjs', 'nuxt', 'svelte', 'gatsby', 'webpack', 'vite']
         }
+        self._index_keywords()
         self.file_patterns = [
             r'.*\.(jsx|tsx|vue|svelte)$',
             r'.*\.(css|scss|sass|less)$',
             r'.*\.(html|htm)$'
         ]
     
-    def analyze(self, task_description: str) -> float:
-        tokens = task_description.lower().split()
+    def analyze(self, task_description: str, tokens: Optional[List[str]] = None) -> float:
+        if tokens is None:
+            tokens = task_description.lower().split()
         token_count = len(tokens) if tokens else 1
         
         # Fast keyword matching with better scoring
-        primary_matches = sum(1 for token in tokens if token in self.keywords['primary'])
-        secondary_matches = sum(1 for token in tokens if token in self.keywords['secondary'])
-        framework_matches = sum(1 for token in tokens if token in self.keywords['frameworks'])
+        primary_matches, secondary_matches, framework_matches = self._count_keyword_matches(tokens)
         
         # File pattern matching
         pattern_matches = sum(1 for pattern in self.file_patterns 
@@ -72,14 +95,14 @@ class BackendDomainProcessor(DomainProcessor):
             'secondary': ['auth', 'authentication', 'middleware', 'controller', 'model'],
             'technologies': ['nodejs', 'python', 'django', 'flask', 'express', 'fastapi']
         }
+        self._index_keywords()
     
-    def analyze(self, task_description: str) -> float:
-        tokens = task_description.lower().split()
+    def analyze(self, task_description: str, tokens: Optional[List[str]] = None) -> float:
+        if tokens is None:
+            tokens = task_description.lower().split()
         token_count = len(tokens) if tokens else 1
         
-        primary_matches = sum(1 for token in tokens if token in self.keywords['primary'])
-        secondary_matches = sum(1 for token in tokens if token in self.keywords['secondary'])
-        tech_matches = sum(1 for token in tokens if token in self.keywords['technologies'])
+        primary_matches, secondary_matches, tech_matches = self._count_keyword_matches(tokens)
         
         keyword_score = (primary_matches * 0.6 + secondary_matches * 0.4 + 
                         tech_matches * 0.5) / token_count
@@ -98,14 +121,14 @@ class SecurityDomainProcessor(DomainProcessor):
             'secondary': ['audit', 'secure', 'encrypt', 'decrypt', 'token', 'jwt'],
             'threats': ['xss', 'csrf', 'injection', 'breach', 'attack', 'threat']
         }
+        self._index_keywords()
     
-    def analyze(self, task_description: str) -> float:
-        tokens = task_description.lower().split()
+    def analyze(self, task_description: str, tokens: Optional[List[str]] = None) -> float:
+        if tokens is None:
+            tokens = task_description.lower().split()
         token_count = len(tokens) if tokens else 1
         
-        primary_matches = sum(1 for token in tokens if token in self.keywords['primary'])
-        secondary_matches = sum(1 for token in tokens if token in self.keywords['secondary'])
-        threat_matches = sum(1 for token in tokens if token in self.keywords['threats'])
+        primary_matches, secondary_matches, threat_matches = self._count_keyword_matches(tokens)
         
         keyword_score = (primary_matches * 0.7 + secondary_matches * 0.5 + 
                         threat_matches * 0.6) / token_count
@@ -124,16 +147,19 @@ class InfrastructureDomainProcessor(DomainProcessor):
             'secondary': ['ci/cd', 'pipeline', 'kubernetes', 'helm', 'terraform'],
             'operations': ['monitor', 'scale', 'backup', 'restore', 'migrate']
         }
+        self._index_keywords()
+        # Primary keywords match as substrings of a token, all tried in one search
+        self._primary_re = re.compile('|'.join(map(re.escape, self.keywords['primary'])))
     
-    def analyze(self, task_description: str) -> float:
-        tokens = task_description.lower().split()
+    def analyze(self, task_description: str, tokens: Optional[List[str]] = None) -> float:
+        if tokens is None:
+            tokens = task_description.lower().split()
         token_count = len(tokens) if tokens else 1
         
         # Use substring matching for compound words like "deployment"
-        primary_matches = sum(1 for token in tokens 
-                            if any(keyword in token for keyword in self.keywords['primary']))
-        secondary_matches = sum(1 for token in tokens if token in self.keywords['secondary'])
-        ops_matches = sum(1 for token in tokens if token in self.keywords['operations'])
+        primary_search = self._primary_re.search
+        primary_matches = sum(1 for token in tokens if primary_search(token))
+        _, secondary_matches, ops_matches = self._count_keyword_matches(tokens)
         
         keyword_score = (primary_matches * 0.6 + secondary_matches * 0.4 + 
                         ops_matches * 0.3) / token_count
@@ -152,14 +178,14 @@ class TestingDomainProcessor(DomainProcessor):
             'secondary': ['unit', 'integration', 'e2e', 'coverage', 'mock'],
             'frameworks': ['jest', 'pytest', 'cypress', 'selenium', 'mocha']
         }
+        self._index_keywords()
     
-    def analyze(self, task_description: str) -> float:
-        tokens = task_description.lower().split()
+    def analyze(self, task_description: str, tokens: Optional[List[str]] = None) -> float:
+        if tokens is None:
+            tokens = task_description.lower().split()
         token_count = len(tokens) if tokens else 1
         
-        primary_matches = sum(1 for token in tokens if token in self.keywords['primary'])
-        secondary_matches = sum(1 for token in tokens if token in self.keywords['secondary'])
-        framework_matches = sum(1 for token in tokens if token in self.keywords['frameworks'])
+        primary_matches, secondary_matches, framework_matches = self._count_keyword_matches(tokens)
         
         keyword_score = (primary_matches * 0.6 + secondary_matches * 0.4 + 
                         framework_matches * 0.3) / token_count
@@ -178,14 +204,14 @@ class DocumentationDomainProcessor(DomainProcessor):
             'secondary': ['wiki', 'docs', 'api-doc', 'tutorial', 'example'],
             'actions': ['write', 'create', 'generate', 'update', 'maintain']
         }
+        self._index_keywords()
     
-    def analyze(self, task_description: str) -> float:
-        tokens = task_description.lower().split()
+    def analyze(self, task_description: str, tokens: Optional[List[str]] = None) -> float:
+        if tokens is None:
+            tokens = task_description.lower().split()
         token_count = len(tokens) if tokens else 1
         
-        primary_matches = sum(1 for token in tokens if token in self.keywords['primary'])
-        secondary_matches = sum(1 for token in tokens if token in self.keywords['secondary'])
-        action_matches = sum(1 for token in tokens if token in self.keywords['actions'])
+        primary_matches, secondary_matches, action_matches = self._count_keyword_matches(tokens)
         
         keyword_score = (primary_matches * 0.7 + secondary_matches * 0.5 + 
                         action_matches * 0.2) / token_count
@@ -212,9 +238,14 @@ class DomainDetectionEngine:
         detected_domains = []
         total_confidence = 0
         
+        # Lowercase and tokenize once for every processor; the lowered text is also
+        # returned so downstream stages (escalation analysis) need not redo it
+        task_lower = task_description.lower()
+        tokens = task_lower.split()
+        
         # Run all processors (parallel in future optimization)
         for domain_name, processor in self.processors.items():
-            confidence = processor.analyze(task_description)
+            confidence = processor.analyze(task_description, tokens)
             if confidence > 0.1:  # Even lower threshold for better detection
                 detected_domains.append({
                     'domain': domain_name,
@@ -229,10 +260,64 @@ class DomainDetectionEngine:
         
         analysis_time_ms = (time.perf_counter() - start_time) * 1000
         
+        return self._detection_result(detected_domains, total_confidence, task_lower, analysis_time_ms)
+    
+    def detect_domains_batch(self, task_descriptions: List[str]) -> List[Dict]:
+        """Detect domains for many tasks with one timing window shared across the batch
+        
+        Each processor scans the whole batch before the next one runs, so its keyword
+        tables stay hot. Results match detect_domains; each one reports the batch's
+        mean per-task time.
+        """
+        
+        if not task_descriptions:
+            return []
+        
+        start_time = time.perf_counter()
+        
+        tasks_lower = [task_description.lower() for task_description in task_descriptions]
+        token_lists = [task_lower.split() for task_lower in tasks_lower]
+        detected_per_task = [[] for _ in task_descriptions]
+        totals = [0] * len(task_descriptions)
+        
+        for domain_name, processor in self.processors.items():
+            analyze = processor.analyze
+            for index, (task_description, tokens) in enumerate(zip(task_descriptions, token_lists)):
+                confidence = analyze(task_description, tokens)
+                if confidence > 0.1:
+                    detected_per_task[index].append({
+                        'domain': domain_name,
+                        'confidence': confidence,
+                        'complexity_bias': processor.complexity_bias,
+                        'preferred_agents': processor.preferred_agents
+                    })
+                    totals[index] += confidence
+        
+        for detected_domains in detected_per_task:
+            detected_domains.sort(key=lambda x: x['confidence'], reverse=True)
+        
+        analysis_time_ms = (time.perf_counter() - start_time) * 1000 / len(task_descriptions)
+        
+        return [self._detection_result(detected_domains, total_confidence, task_lower, analysis_time_ms)
+                for detected_domains, total_confidence, task_lower
+                in zip(detected_per_task, totals, tasks_lower)]
+    
+    @staticmethod
+    def _detection_result(detected_domains: List[Dict], total_confidence: float,
+                          task_lower: str, analysis_time_ms: float) -> Dict:
+        """Assemble the detect_domains result from confidence-sorted domains"""
+        
+        domain_count = len(detected_domains)
+        domain_names = [d['domain'] for d in detected_domains]
+        
         return {
             'domains': detected_domains,
-            'domain_count': len(detected_domains),
+            'domain_count': domain_count,
             'total_confidence': total_confidence,
+            'avg_confidence': total_confidence / domain_count if domain_count else 0.0,
+            'domain_names': domain_names,
+            'top_domain_names': domain_names[:3],
             'primary_domain': detected_domains[0]['domain'] if detected_domains else None,
-            'analysis_time_ms': analysis_time_ms
-        }
\ No newline at end of file
+            'analysis_time_ms': analysis_time_ms,
+            'task_lower': task_lower
+        }
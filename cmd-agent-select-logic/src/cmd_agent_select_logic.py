@@ -51,14 +51,12 @@ class CmdAgentSelectLogic:
         start_time = time.perf_counter()
         
         try:
-            # Step 1: Input validation
-            is_valid, validation_message = self.validator.validate_task_description(task_description)
+            # Steps 1-2: Input validation and sanitization in a single pass
+            is_valid, validation_message, clean_description = \
+                self.validator.validate_and_sanitize(task_description)
             if not is_valid:
                 return self._create_validation_error_decision(validation_message)
             
-            # Step 2: Sanitize input
-            clean_description = self.validator.sanitize_input(task_description)
-            
             # Step 3: Execute routing with circuit breaker protection
             if self.circuit_breaker:
                 decision = self.circuit_breaker.execute(
@@ -116,11 +114,6 @@ class CmdAgentSelectLogic:
         # Step 1: Task classification
         task_analysis = self.classifier.classify_task(task_description)
         
-        # Check performance target for classification
-        if task_analysis.analysis_time_ms > self.performance_targets.get('simple_task_ms', 50):
-            # Log performance issue but continue
-            pass
-        
         # Step 2: Route based on analysis
         routing_decision = self.router.route_task(task_analysis)
         
@@ -1,10 +1,11 @@
 # src/core/error_handling.py
 import time
 import logging
+from collections import deque
 from typing import Dict, Optional, Any, Callable
 from enum import Enum
 from dataclasses import dataclass
-from ..core.models import RoutingDecision, RoutingAction
+from ..core.models import RoutingDecision, RoutingAction, AGENT_ORCH_TASKS
 
 class ErrorSeverity(Enum):
     LOW = "low"
@@ -17,6 +18,37 @@ class CircuitBreakerState(Enum):
     OPEN = "open"
     HALF_OPEN = "half_open"
 
+# Error type name -> severity; unlisted types are LOW
+_SEVERITY_MAP = {
+    'SystemError': ErrorSeverity.CRITICAL,
+    'MemoryError': ErrorSeverity.CRITICAL,
+    'OSError': ErrorSeverity.CRITICAL,
+    'ValueError': ErrorSeverity.HIGH,
+    'TypeError': ErrorSeverity.HIGH,
+    'AttributeError': ErrorSeverity.HIGH,
+    'KeyError': ErrorSeverity.MEDIUM,
+    'IndexError': ErrorSeverity.MEDIUM,
+    'ImportError': ErrorSeverity.MEDIUM
+}
+
+# Error type name -> recovery suggestion
+_RECOVERY_MAP = {
+    'ValueError': 'Check input validation and data formatting',
+    'TypeError': 'Verify function arguments and data types',
+    'KeyError': 'Check dictionary keys and configuration',
+    'AttributeError': 'Verify object attributes and method names',
+    'ImportError': 'Check module dependencies and installation',
+    'MemoryError': 'Reduce processing load and check system resources',
+    'OSError': 'Check system resources and file permissions'
+}
+
+# Breaker state -> fallback routing reasoning
+_STATE_MESSAGES = {
+    CircuitBreakerState.OPEN: "Circuit breaker OPEN - system protection active",
+    CircuitBreakerState.HALF_OPEN: "Circuit breaker HALF_OPEN - recovery testing",
+    CircuitBreakerState.CLOSED: "Circuit breaker fallback - unexpected path"
+}
+
 @dataclass
 class ErrorContext:
     error_type: str
@@ -48,38 +80,55 @@ class RoutingCircuitBreaker:
         self.failure_count = 0
         self.success_count = 0
         self.last_failure_time = None
+        self.is_closed_fast = True  # Mirrors state == CLOSED, kept in sync by the state setter
         self.state = CircuitBreakerState.CLOSED
-        self.error_log = []
-        
-        # Enhanced 3-State Pattern Metrics
-        self.state_transitions = {
-            'closed_to_open': 0,
-            'open_to_half_open': 0,
-            'half_open_to_closed': 0,
-            'half_open_to_open': 0
-        }
-        self.uptime_stats = {
-            'total_requests': 0,
-            'successful_requests': 0,
-            'failed_requests': 0,
-            'circuit_open_count': 0
-        }
+        self.error_log = deque(maxlen=50)  # Keeps only the last 50 errors
+        
+        # Enhanced 3-State Pattern Metrics - plain int attributes, incremented per
+        # request; get_circuit_status reports them under their dict names
+        self.closed_to_open = 0
+        self.open_to_half_open = 0
+        self.half_open_to_closed = 0
+        self.half_open_to_open = 0
         
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
+        self.total_requests = 0
+        self.successful_requests = 0
+        self.failed_requests = 0
+        self.circuit_open_count = 0
+        
+        # Logging configuration is left to the application
         self.logger = logging.getLogger(__name__)
     
+    @property
+    def state(self) -> CircuitBreakerState:
+        return self._state
+    
+    @state.setter
+    def state(self, new_state: CircuitBreakerState):
+        self._state = new_state
+        self.is_closed_fast = new_state is CircuitBreakerState.CLOSED
+    
+    def record_closed_success(self):
+        """Record a successful direct call made while CLOSED (same counters as execute)"""
+        self.total_requests += 1
+        self._record_success()
+    
+    def record_closed_failure(self, error: Exception, *args, **kwargs) -> RoutingDecision:
+        """Record a failed direct call made while CLOSED and return fallback routing"""
+        self.total_requests += 1
+        return self._handle_closed_failure(error, *args, **kwargs)
+    
     def execute(self, routing_function: Callable, *args, **kwargs) -> Any:
         """Execute routing function with enhanced 3-state circuit breaker protection"""
         
-        self.uptime_stats['total_requests'] += 1
+        self.total_requests += 1
         
         # OPEN State: Fail fast until recovery timeout
         if self.state == CircuitBreakerState.OPEN:
             if self._should_attempt_reset():
                 self._transition_to_half_open()
             else:
-                self.uptime_stats['circuit_open_count'] += 1
+                self.circuit_open_count += 1
                 return self._fallback_routing(*args, **kwargs)
         
         # HALF_OPEN State: Limited testing mode
@@ -93,23 +142,27 @@ class RoutingCircuitBreaker:
             return result
             
         except Exception as e:
-            error_context = ErrorContext(
-                error_type=type(e).__name__,
-                severity=self._classify_error_severity(e),
-                message=str(e),
-                timestamp=time.time(),
-                component="routing_engine",
-                recovery_suggestion=self._get_recovery_suggestion(e)
-            )
-            
-            self._record_failure(error_context)
-            return self._fallback_routing(*args, **kwargs)
+            return self._handle_closed_failure(e, *args, **kwargs)
+    
+    def _handle_closed_failure(self, error: Exception, *args, **kwargs) -> RoutingDecision:
+        """Record a CLOSED-state failure and fall back to safe routing"""
+        error_context = ErrorContext(
+            error_type=type(error).__name__,
+            severity=self._classify_error_severity(error),
+            message=str(error),
+            timestamp=time.time(),  # Also becomes last_failure_time
+            component="routing_engine",
+            recovery_suggestion=self._get_recovery_suggestion(error)
+        )
+        
+        self._record_failure(error_context)
+        return self._fallback_routing(*args, **kwargs)
     
     def _transition_to_half_open(self):
         """Transition from OPEN to HALF_OPEN state"""
         self.state = CircuitBreakerState.HALF_OPEN
         self.success_count = 0
-        self.state_transitions['open_to_half_open'] += 1
+        self.open_to_half_open += 1
         self.logger.info("Circuit breaker transitioning to HALF_OPEN state - testing recovery")
     
     def _execute_half_open(self, routing_function: Callable, *args, **kwargs) -> Any:
@@ -119,12 +172,13 @@ class RoutingCircuitBreaker:
             self._record_half_open_success()
             return result
         except Exception as e:
-            self._record_half_open_failure()
+            now = time.time()
+            self._record_half_open_failure(now)
             error_context = ErrorContext(
                 error_type=type(e).__name__,
                 severity=self._classify_error_severity(e),
                 message=str(e),
-                timestamp=time.time(),
+                timestamp=now,
                 component="routing_engine_half_open",
                 recovery_suggestion=self._get_recovery_suggestion(e)
             )
@@ -134,24 +188,24 @@ class RoutingCircuitBreaker:
     def _record_half_open_success(self):
         """Record successful operation in HALF_OPEN state"""
         self.success_count += 1
-        self.uptime_stats['successful_requests'] += 1
+        self.successful_requests += 1
         
         # Transition to CLOSED after success threshold met
         if self.success_count >= self.success_threshold:
             self.state = CircuitBreakerState.CLOSED
             self.failure_count = 0
-            self.state_transitions['half_open_to_closed'] += 1
+            self.half_open_to_closed += 1
             self.logger.info(f"Circuit breaker CLOSED - recovery successful after {self.success_count} tests")
     
-    def _record_half_open_failure(self):
+    def _record_half_open_failure(self, now: float):
         """Record failed operation in HALF_OPEN state"""
         self.failure_count += 1
-        self.last_failure_time = time.time()
-        self.uptime_stats['failed_requests'] += 1
+        self.last_failure_time = now
+        self.failed_requests += 1
         
         # Transition back to OPEN on any failure in HALF_OPEN
         self.state = CircuitBreakerState.OPEN
-        self.state_transitions['half_open_to_open'] += 1
+        self.half_open_to_open += 1
         self.logger.warning("Circuit breaker returned to OPEN state - recovery test failed")
     
     def _should_attempt_reset(self) -> bool:
@@ -163,43 +217,33 @@ class RoutingCircuitBreaker:
     def _record_success(self):
         """Record successful operation in CLOSED state"""
         self.failure_count = 0
-        self.uptime_stats['successful_requests'] += 1
+        self.successful_requests += 1
     
     def _record_failure(self, error_context: ErrorContext):
         """Record failed operation with enhanced state transition logic"""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = error_context.timestamp
         self.error_log.append(error_context)
-        self.uptime_stats['failed_requests'] += 1
-        
-        # Keep only last 50 errors
-        if len(self.error_log) > 50:
-            self.error_log = self.error_log[-50:]
+        self.failed_requests += 1
         
         self.logger.warning(f"Circuit breaker failure recorded: {error_context.message}")
         
         # Transition to OPEN when failure threshold reached
         if self.failure_count >= self.failure_threshold:
             self.state = CircuitBreakerState.OPEN
-            self.state_transitions['closed_to_open'] += 1
+            self.closed_to_open += 1
             self.logger.error(f"Circuit breaker OPENED after {self.failure_count} failures")
     
     def _fallback_routing(self, task_description: str = "", *args, **kwargs) -> RoutingDecision:
         """Enhanced fallback routing with state-aware messaging"""
         
-        state_messages = {
-            CircuitBreakerState.OPEN: "Circuit breaker OPEN - system protection active",
-            CircuitBreakerState.HALF_OPEN: "Circuit breaker HALF_OPEN - recovery testing",
-            CircuitBreakerState.CLOSED: "Circuit breaker fallback - unexpected path"
-        }
-        
-        reasoning = state_messages.get(self.state, f'Circuit breaker fallback - state: {self.state.value}')
+        reasoning = _STATE_MESSAGES.get(self.state, f'Circuit breaker fallback - state: {self.state.value}')
         
         self.logger.info(f"Using fallback routing - {reasoning}")
         
         return RoutingDecision(
             action=RoutingAction.ESCALATE,
-            selected_agent='@orchestrate-tasks',  # Safe fallback
+            selected_agent=AGENT_ORCH_TASKS,  # Safe fallback
             orchestration_type=None,
             confidence=0.6,
             reasoning=reasoning,
@@ -212,69 +256,63 @@ class RoutingCircuitBreaker:
     def _classify_error_severity(self, error: Exception) -> ErrorSeverity:
         """Classify error severity based on error type"""
         
-        critical_errors = ['SystemError', 'MemoryError', 'OSError']
-        high_errors = ['ValueError', 'TypeError', 'AttributeError']
-        medium_errors = ['KeyError', 'IndexError', 'ImportError']
-        
-        error_type = type(error).__name__
-        
-        if error_type in critical_errors:
-            return ErrorSeverity.CRITICAL
-        elif error_type in high_errors:
-            return ErrorSeverity.HIGH
-        elif error_type in medium_errors:
-            return ErrorSeverity.MEDIUM
-        else:
-            return ErrorSeverity.LOW
+        return _SEVERITY_MAP.get(type(error).__name__, ErrorSeverity.LOW)
     
     def _get_recovery_suggestion(self, error: Exception) -> str:
         """Get recovery suggestion based on error type"""
         
-        error_type = type(error).__name__
-        
-        suggestions = {
-            'ValueError': 'Check input validation and data formatting',
-            'TypeError': 'Verify function arguments and data types',
-            'KeyError': 'Check dictionary keys and configuration',
-            'AttributeError': 'Verify object attributes and method names',
-            'ImportError': 'Check module dependencies and installation',
-            'MemoryError': 'Reduce processing load and check system resources',
-            'OSError': 'Check system resources and file permissions'
-        }
-        
-        return suggestions.get(error_type, 'Check system logs and configuration')
+        return _RECOVERY_MAP.get(type(error).__name__, 'Check system logs and configuration')
     
     def get_circuit_status(self) -> Dict:
         """Get comprehensive circuit breaker status with 3-state metrics"""
         
-        recent_errors = [e for e in self.error_log 
-                        if time.time() - e.timestamp < 300]  # Last 5 minutes
+        # One clock read shared by the error window and the reset countdowns
+        now = time.time()
+        
+        # Errors are appended chronologically, so count back from the newest
+        # and stop at the first one outside the 5 minute window
+        cutoff = now - 300
+        recent_errors_count = 0
+        for error in reversed(self.error_log):
+            if error.timestamp <= cutoff:
+                break
+            recent_errors_count += 1
         
         # Calculate uptime percentage (99.9% target)
-        uptime_percentage = (self.uptime_stats['successful_requests'] / 
-                           max(self.uptime_stats['total_requests'], 1)) * 100
+        uptime_percentage = (self.successful_requests / 
+                           max(self.total_requests, 1)) * 100
         
         return {
             'state': self.state.value,
             'failure_count': self.failure_count,
             'success_count': self.success_count,
             'last_failure_time': self.last_failure_time,
-            'recent_errors_count': len(recent_errors),
+            'recent_errors_count': recent_errors_count,
             'total_errors_logged': len(self.error_log),
-            'error_rate_last_5min': len(recent_errors) / 5 if recent_errors else 0,
-            'time_to_next_attempt': max(0, self.recovery_timeout - (time.time() - (self.last_failure_time or 0))),
+            'error_rate_last_5min': recent_errors_count / 5 if recent_errors_count else 0,
+            'time_to_next_attempt': max(0, self.recovery_timeout - (now - (self.last_failure_time or 0))),
             
             # Enhanced 3-State Pattern Metrics
-            'state_transitions': self.state_transitions.copy(),
-            'uptime_stats': self.uptime_stats.copy(),
+            'state_transitions': {
+                'closed_to_open': self.closed_to_open,
+                'open_to_half_open': self.open_to_half_open,
+                'half_open_to_closed': self.half_open_to_closed,
+                'half_open_to_open': self.half_open_to_open
+            },
+            'uptime_stats': {
+                'total_requests': self.total_requests,
+                'successful_requests': self.successful_requests,
+                'failed_requests': self.failed_requests,
+                'circuit_open_count': self.circuit_open_count
+            },
             'uptime_percentage': uptime_percentage,
             'meets_uptime_target': uptime_percentage >= 99.9,
             
             # State-specific information
-            'state_info': self._get_state_specific_info()
+            'state_info': self._get_state_specific_info(now)
         }
     
-    def _get_state_specific_info(self) -> Dict:
+    def _get_state_specific_info(self, now: float) -> Dict:
         """Get information specific to current circuit breaker state"""
         
         if self.state == CircuitBreakerState.CLOSED:
@@ -285,7 +323,7 @@ class RoutingCircuitBreaker:
         elif self.state == CircuitBreakerState.OPEN:
             return {
                 'description': 'Circuit open - failing fast for protection',
-                'seconds_until_half_open': max(0, int(self.recovery_timeout - (time.time() - (self.last_failure_time or 0))))
+                'seconds_until_half_open': max(0, int(self.recovery_timeout - (now - (self.last_failure_time or 0))))
             }
         elif self.state == CircuitBreakerState.HALF_OPEN:
             return {
@@ -334,7 +372,7 @@ class GracefulDegradation:
         
         return RoutingDecision(
             action=RoutingAction.ESCALATE,
-            selected_agent='@orchestrate-tasks',  # Most reliable fallback
+            selected_agent=AGENT_ORCH_TASKS,  # Most reliable fallback
             orchestration_type=None,
             confidence=0.5,
             reasoning='Emergency routing activated due to system degradation',
@@ -380,7 +418,7 @@ class ErrorRecovery:
         return RoutingDecision(
             action=RoutingAction.ORCHESTRATION,
             selected_agent=None,
-            orchestration_type='@orchestrate-tasks',
+            orchestration_type=AGENT_ORCH_TASKS,
             confidence=0.5,
             reasoning='Recovered from classification failure using simple heuristics',
             analysis_time_ms=0,
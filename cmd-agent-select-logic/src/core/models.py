@@ -1,4 +1,5 @@
 # src/core/models.py
+import sys
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 from enum import Enum
@@ -13,7 +14,28 @@ class RoutingAction(Enum):
     ORCHESTRATION = "orchestration_routing"
     ESCALATE = "escalate_to_organizer"
 
-@dataclass
+class EscalationAction(Enum):
+    """Escalation decision outcomes"""
+    DIRECT_AGENT_ROUTING = "DIRECT_AGENT_ROUTING"
+    ORCHESTRATION_ROUTING = "ORCHESTRATION_ROUTING" 
+    ESCALATE_TO_ORGANIZER = "ESCALATE_TO_ORGANIZER"
+
+# Agent identifiers shared by the routing engines. Interned once so every
+# decision carries the same string object and dict lookups reuse its cached hash
+AGENT_ORCH_TASKS = sys.intern('@orchestrate-tasks')
+AGENT_ORCH_AGENTS = sys.intern('@orchestrate-agents')
+AGENT_ORCH_ADV = sys.intern('@orchestrate-agents-adv')
+AGENT_ORGANIZER = sys.intern('@agent-organizer')
+AGENT_BUILD_FRONTEND = sys.intern('@build-frontend')
+AGENT_BUILD_BACKEND = sys.intern('@build-backend')
+AGENT_SECURITY_AUDITOR = sys.intern('@security-auditor')
+AGENT_DEPLOY_APPLICATION = sys.intern('@deploy-application')
+AGENT_TEST_AUTOMATION = sys.intern('@test-automation')
+AGENT_GENERATE_DOCUMENTATION = sys.intern('@generate-documentation')
+
+# TaskAnalysis and DomainDetection are never modified after construction;
+# RoutingDecision stays mutable because callers annotate it after routing
+@dataclass(frozen=True)
 class TaskAnalysis:
     description: str
     complexity_score: float
@@ -21,8 +43,9 @@ class TaskAnalysis:
     estimated_tokens: int
     estimated_time_minutes: int
     analysis_time_ms: float = 0.0
+    cache_hit: bool = False
     
-@dataclass
+@dataclass(frozen=True)
 class DomainDetection:
     domain: str
     confidence: float
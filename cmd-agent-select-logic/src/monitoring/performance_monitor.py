@@ -1,10 +1,14 @@
 # src/monitoring/performance_monitor.py
 import time
+import math
+from bisect import bisect_right
 import statistics
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from collections import deque
+from itertools import islice
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from ..core.models import RoutingAction, EscalationAction
 
 @dataclass
 class PerformanceMetrics:
@@ -17,6 +21,41 @@ class PerformanceMetrics:
     domain_count: int
     success: bool = True
 
+def _mean(values) -> float:
+    """Arithmetic mean via math.fsum - statistics.mean's exact Fraction arithmetic is far slower"""
+    return math.fsum(values) / len(values)
+
+@dataclass
+class ResponseTimeStats:
+    """Response time summary for one metrics window"""
+    mean: float
+    std_deviation: float
+    median: float
+    p95: float
+    p99: float
+    minimum: float
+    maximum: float
+
+@dataclass
+class MetricsWindow:
+    """Per-field columns for the metrics recorded inside one time window"""
+    timestamps: List[float]
+    response_times: List[float]
+    actions: List[int]  # Interned action codes, see PerformanceMonitor._intern_action
+    cache_hits: List[bool]
+    complexity_scores: List[float]
+    domain_counts: List[int]
+    successes: List[bool]
+    
+    # Aggregates shared by every analysis of the window
+    success_count: int = 0
+    cache_hit_count: int = 0
+    complexity_counts: Tuple[int, int, int] = (0, 0, 0)  # simple, standard, complex
+    response_time_stats: Optional[ResponseTimeStats] = None  # Filled on first use
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
 @dataclass
 class SREGoldenSignals:
     """Google SRE Golden Signals for system reliability
@@ -27,6 +66,14 @@ class SREGoldenSignals:
     3. Errors - Rate of requests that fail
     4. Saturation - How full your service is (resource utilization)
     """
+    # Up to max_history snapshots are retained, so drop the per-instance __dict__
+    # (dataclass(slots=True) needs Python 3.10; no field has a default, so this is safe)
+    __slots__ = (
+        'timestamp', 'latency_p50_ms', 'latency_p95_ms', 'latency_p99_ms', 'traffic_rps',
+        'error_rate_percent', 'saturation_cpu_percent', 'saturation_memory_percent',
+        'saturation_max_percent'
+    )
+    
     timestamp: float
     latency_p50_ms: float
     latency_p95_ms: float
@@ -35,6 +82,7 @@ class SREGoldenSignals:
     error_rate_percent: float
     saturation_cpu_percent: float  # Simplified CPU utilization proxy
     saturation_memory_percent: float  # Simplified memory utilization proxy
+    saturation_max_percent: float  # max(cpu, memory), computed once at snapshot time
 
 class PerformanceMonitor:
     """Comprehensive performance monitoring with Google SRE Golden Signals
@@ -48,12 +96,58 @@ class PerformanceMonitor:
     Plus essential service-specific metrics for routing system
     """
     
-    def __init__(self, max_history: int = 1000):
+    # Based on Google SRE research, the 4 Golden Signals can detect ~80% of production issues.
+    # Input-independent, so the overall figure is computed once here
+    _DETECTION_CATEGORIES = {
+        'performance_issues': 90,    # Latency + Saturation signals
+        'availability_issues': 85,   # Error rate + Traffic signals
+        'capacity_issues': 80,       # Saturation + Traffic signals
+        'user_experience_issues': 75 # Latency + Error rate signals
+    }
+    _OVERALL_DETECTION = statistics.mean(_DETECTION_CATEGORIES.values())
+    
+    def __init__(self, max_history: int = 1000, golden_signals_interval_s: float = 1.0):
         self.max_history = max_history
         
-        # Performance metrics storage (existing - PRESERVE ALL FUNCTIONALITY)
-        self.metrics_history = deque(maxlen=max_history)
-        self.response_times = deque(maxlen=max_history)
+        # Performance metrics storage - one bounded column per analysed PerformanceMetrics
+        # field (structure-of-arrays), so analyses read a field without touching
+        # every record object. Index i of each column is the same decision.
+        # Bool, action-code and domain-count columns hold shared small-int/bool objects,
+        # so only the float columns cost an object per entry; confidence is not analysed
+        # and is not retained
+        self.metric_timestamps = deque(maxlen=max_history)
+        self.response_times = deque(maxlen=max_history)  # decision_time_ms column
+        self.metric_actions = deque(maxlen=max_history)  # Interned action codes
+        self.metric_cache_hits = deque(maxlen=max_history)
+        self.metric_complexity_scores = deque(maxlen=max_history)
+        self.metric_domain_counts = deque(maxlen=max_history)
+        self.metric_successes = deque(maxlen=max_history)
+        self._metric_columns = (
+            self.metric_timestamps, self.response_times, self.metric_actions,
+            self.metric_cache_hits, self.metric_complexity_scores,
+            self.metric_domain_counts, self.metric_successes
+        )
+        
+        # Action interning: each distinct action value gets a small int code the first
+        # time it is seen, so the action column and per-action grouping work on ints
+        self._action_codes = {}
+        self._action_values = []
+        for action in RoutingAction:
+            self._intern_action(action)
+        # Every spelling of an escalation the routers record: Phase 1 passes
+        # RoutingAction values, Phase 2 EscalationAction values, and the fallback
+        # decisions the bare 'ESCALATE' string
+        self._escalate_codes = frozenset(map(self._intern_action, (
+            RoutingAction.ESCALATE, RoutingAction.ESCALATE.value,
+            EscalationAction.ESCALATE_TO_ORGANIZER, EscalationAction.ESCALATE_TO_ORGANIZER.value,
+            'ESCALATE'
+        )))
+        
+        # Running aggregates over everything currently stored, adjusted on append and
+        # eviction so a window spanning the whole history needs no recount
+        self._history_success_count = 0
+        self._history_cache_hit_count = 0
+        self._history_complexity_counts = [0, 0, 0]  # simple, standard, complex
         
         # Real-time counters (existing - PRESERVE ALL FUNCTIONALITY)
         self.total_requests = 0
@@ -70,8 +164,12 @@ class PerformanceMonitor:
             'success_rate': 0.9
         }
         
-        # Google SRE Golden Signals Storage
+        # Google SRE Golden Signals Storage - snapshots are regenerated at most once
+        # per golden_signals_interval_s of wall-clock time, however bursty the traffic
+        self.golden_signals_interval_s = golden_signals_interval_s
+        self._last_golden_signals_time = 0.0
         self.golden_signals_history = deque(maxlen=max_history)
+        self._golden_signals_cache = (None, None)  # (latest snapshot, (latency trend, traffic trend, health score))
         self.request_timestamps = deque(maxlen=1000)  # For traffic calculation
         
         # SRE Service-Specific Metrics (minimal set)
@@ -97,17 +195,62 @@ class PerformanceMonitor:
         self.alert_thresholds = {
             'avg_response_time_ms': 150,
             'error_rate_percent': 10,
-            'cache_hit_rate_percent': 60
+            'cache_hit_rate_percent': 60,
+            'slow_decision_ms': 300  # Per-request slow decision alert
         }
         
     def record_routing_decision(self, decision_data: Dict, success: bool = True):
         """Record a routing decision with comprehensive metrics (existing functionality preserved)"""
         
-        self.total_requests += 1
         current_timestamp = time.time()
+        metrics = self._store_decision(decision_data, success, current_timestamp)
+        
+        # Generate SRE Golden Signals (time-gated to minimize overhead)
+        refresh_golden_signals = self._refresh_golden_signals(current_timestamp)
+            
+        # Check for alerts (existing and SRE - the latter only for a fresh snapshot)
+        self._check_performance_alerts(metrics)
+        if refresh_golden_signals:
+            self._check_sre_alerts()
+    
+    def record_routing_decision_batch(self, decisions: List[Dict], successes: Optional[List[bool]] = None):
+        """Record a burst of routing decisions with one clock read and one golden signals check"""
+        
+        if not decisions:
+            return
+        if successes is None:
+            successes = [True] * len(decisions)
+        elif len(successes) != len(decisions):
+            raise ValueError("successes must have one entry per decision")
+        
+        current_timestamp = time.time()
+        for decision_data, success in zip(decisions, successes):
+            metrics = self._store_decision(decision_data, success, current_timestamp)
+            self._check_performance_alerts(metrics)
+        
+        if self._refresh_golden_signals(current_timestamp):
+            self._check_sre_alerts()
+    
+    def _refresh_golden_signals(self, current_timestamp: float) -> bool:
+        """Take a golden signals snapshot if the interval has elapsed; True if one was taken"""
+        
+        if current_timestamp - self._last_golden_signals_time < self.golden_signals_interval_s:
+            return False
+        self._generate_golden_signals(current_timestamp)
+        self._last_golden_signals_time = current_timestamp
+        return True
+    
+    def _store_decision(self, decision_data: Dict, success: bool, current_timestamp: float) -> PerformanceMetrics:
+        """Append one decision to the metric columns and update counters and service metrics"""
+        
+        self.total_requests += 1
         
-        # Record request timestamp for traffic calculation
-        self.request_timestamps.append(current_timestamp)
+        # Record request timestamp for traffic calculation, evicting entries older
+        # than one second so the deque only ever holds the current RPS window
+        request_timestamps = self.request_timestamps
+        request_timestamps.append(current_timestamp)
+        while current_timestamp - request_timestamps[0] >= 1.0:
+            request_timestamps.popleft()
         
         # Create metrics record (existing logic preserved)
         metrics = PerformanceMetrics(
@@ -121,9 +264,26 @@ class PerformanceMonitor:
             success=success
         )
         
-        # Store metrics (existing logic preserved)
-        self.metrics_history.append(metrics)
+        # Store metrics column by column, first retiring the oldest entry from the
+        # running aggregates when the columns are full and it is about to drop off.
+        # With max_history = 0 nothing is retained, so the aggregates stay empty too
+        if self.max_history > 0:
+            if len(self.metric_timestamps) == self.max_history:
+                self._history_success_count -= self.metric_successes[0]
+                self._history_cache_hit_count -= self.metric_cache_hits[0]
+                self._history_complexity_counts[self._complexity_bucket(self.metric_complexity_scores[0])] -= 1
+            self._history_success_count += bool(success)
+            self._history_cache_hit_count += bool(metrics.cache_hit)
+            self._history_complexity_counts[self._complexity_bucket(metrics.complexity_score)] += 1
+        
+        self.metric_timestamps.append(current_timestamp)
         self.response_times.append(metrics.decision_time_ms)
+        action_code = self._intern_action(metrics.action)
+        self.metric_actions.append(action_code)
+        self.metric_cache_hits.append(bool(metrics.cache_hit))
+        self.metric_complexity_scores.append(metrics.complexity_score)
+        self.metric_domain_counts.append(metrics.domain_count)
+        self.metric_successes.append(bool(success))
         
         # Update counters (existing logic preserved)
         if success:
@@ -137,25 +297,26 @@ class PerformanceMonitor:
             self.performance_targets_met += 1
             
         # Update SRE service-specific metrics
-        self._update_service_metrics(decision_data, success)
+        self._update_service_metrics(action_code, success)
         
-        # Generate SRE Golden Signals (every 10 requests to minimize overhead)
-        if self.total_requests % 10 == 0:
-            self._generate_golden_signals()
-            
-        # Check for alerts (existing and SRE)
-        self._check_performance_alerts(metrics)
-        self._check_sre_alerts()
+        return metrics
+    
+    def _intern_action(self, action) -> int:
+        """Return the int code for an action value, assigning the next code if new"""
+        code = self._action_codes.get(action)
+        if code is None:
+            code = self._action_codes[action] = len(self._action_values)
+            self._action_values.append(action)
+        return code
     
-    def _update_service_metrics(self, decision_data: Dict, success: bool):
+    def _update_service_metrics(self, action_code: int, success: bool):
         """Update service-specific metrics for routing system"""
         
-        # Calculate requests per second (simple moving average)
-        recent_requests = [ts for ts in self.request_timestamps if time.time() - ts < 1.0]
-        self.service_metrics['routing_decisions_per_second'] = len(recent_requests)
+        # Requests per second - request_timestamps is trimmed to the last second on append
+        self.service_metrics['routing_decisions_per_second'] = len(self.request_timestamps)
         
         # Calculate agent selection accuracy (successful non-escalated routes)
-        escalated = decision_data.get('action') == 'ESCALATE'
+        escalated = action_code in self._escalate_codes
         if success and not escalated:
             # Simple exponential moving average for accuracy
             current_accuracy = self.service_metrics['agent_selection_accuracy']
@@ -170,38 +331,73 @@ class PerformanceMonitor:
             current_rate = self.service_metrics['escalation_rate']
             self.service_metrics['escalation_rate'] = current_rate * 0.95 + escalation_rate * 0.05
     
-    def _generate_golden_signals(self):
-        """Generate Google SRE Golden Signals snapshot"""
+    def _window(self, cutoff_time: float) -> MetricsWindow:
+        """Copy out the metric columns for entries recorded after cutoff_time"""
+        
+        # Timestamps are appended in order, so binary search for the first entry
+        # after the cutoff instead of scanning
+        start = bisect_right(self.metric_timestamps, cutoff_time)
+        window = MetricsWindow(*[list(islice(column, start, None)) for column in self._metric_columns])
+        
+        if start == 0:
+            window.success_count = self._history_success_count
+            window.cache_hit_count = self._history_cache_hit_count
+            window.complexity_counts = tuple(self._history_complexity_counts)
+        else:
+            complexity_counts = [0, 0, 0]
+            for complexity in window.complexity_scores:
+                complexity_counts[self._complexity_bucket(complexity)] += 1
+            window.success_count = sum(window.successes)
+            window.cache_hit_count = sum(window.cache_hits)
+            window.complexity_counts = tuple(complexity_counts)
+        
+        return window
+    
+    @staticmethod
+    def _complexity_bucket(complexity_score: float) -> int:
+        """Bucket index for a complexity score: 0=simple, 1=standard, 2=complex"""
+        if complexity_score < 0.4:
+            return 0
+        elif complexity_score < 0.7:
+            return 1
+        return 2
+    
+    def _generate_golden_signals(self, current_time: float):
+        """Generate Google SRE Golden Signals snapshot as of current_time"""
         
-        current_time = time.time()
-        recent_metrics = [m for m in self.metrics_history if current_time - m.timestamp < 60]  # Last 60 seconds
+        # Last 60 seconds. Only four columns are needed, each read once straight from
+        # the newest end of its deque - no MetricsWindow copy of all eight columns
+        recent_count = len(self.metric_timestamps) - bisect_right(self.metric_timestamps, current_time - 60)
         
-        if not recent_metrics:
+        if not recent_count:
             return
         
+        def recent(column):
+            return islice(reversed(column), recent_count)
+        
         # Golden Signal 1: LATENCY (P50, P95, P99)
-        response_times = [m.decision_time_ms for m in recent_metrics]
-        latency_p50 = self._percentile(response_times, 50)
-        latency_p95 = self._percentile(response_times, 95)
-        latency_p99 = self._percentile(response_times, 99)
+        response_times = sorted(recent(self.response_times))
+        latency_p50 = self._sorted_median(response_times)
+        latency_p95 = self._sorted_percentile(response_times, 95)
+        latency_p99 = self._sorted_percentile(response_times, 99)
         
         # Golden Signal 2: TRAFFIC (requests per second)
-        traffic_rps = len(recent_metrics) / 60.0  # Requests in last 60 seconds / 60
+        traffic_rps = recent_count / 60.0  # Requests in last 60 seconds / 60
         
         # Golden Signal 3: ERRORS (error rate percentage)
-        failed_requests = sum(1 for m in recent_metrics if not m.success)
-        error_rate_percent = (failed_requests / len(recent_metrics)) * 100
+        failed_requests = recent_count - sum(recent(self.metric_successes))
+        error_rate_percent = (failed_requests / recent_count) * 100
         
         # Golden Signal 4: SATURATION (system resource utilization proxy)
         # Simplified proxies based on routing system characteristics
-        avg_complexity = statistics.mean([m.complexity_score for m in recent_metrics])
-        avg_response_time = statistics.mean(response_times)
+        avg_complexity = math.fsum(recent(self.metric_complexity_scores)) / recent_count
+        avg_response_time = math.fsum(response_times) / recent_count
         
         # CPU proxy: Based on complexity and response time
         cpu_saturation = min((avg_complexity * 50) + (avg_response_time / 10), 100)
         
         # Memory proxy: Based on cache usage and request volume
-        cache_hit_rate = sum(1 for m in recent_metrics if m.cache_hit) / len(recent_metrics)
+        cache_hit_rate = sum(recent(self.metric_cache_hits)) / recent_count
         memory_saturation = min((1 - cache_hit_rate) * 80 + (traffic_rps * 2), 100)
         
         # Create Golden Signals snapshot
@@ -213,7 +409,8 @@ class PerformanceMonitor:
             traffic_rps=traffic_rps,
             error_rate_percent=error_rate_percent,
             saturation_cpu_percent=cpu_saturation,
-            saturation_memory_percent=memory_saturation
+            saturation_memory_percent=memory_saturation,
+            saturation_max_percent=max(cpu_saturation, memory_saturation)
         )
         
         self.golden_signals_history.append(golden_signals)
@@ -228,23 +425,27 @@ class PerformanceMonitor:
         
         # Latency alert (P99 latency)
         if latest_signals.latency_p99_ms > self.sre_thresholds['latency_p99_ms']:
-            self.logger.warning(f"SRE ALERT - High P99 latency: {latest_signals.latency_p99_ms:.1f}ms > {self.sre_thresholds['latency_p99_ms']}ms")
+            self.logger.warning("SRE ALERT - High P99 latency: %.1fms > %sms",
+                                latest_signals.latency_p99_ms, self.sre_thresholds['latency_p99_ms'])
         
         # Error rate alert
         if latest_signals.error_rate_percent > self.sre_thresholds['error_rate_percent']:
-            self.logger.error(f"SRE ALERT - High error rate: {latest_signals.error_rate_percent:.1f}% > {self.sre_thresholds['error_rate_percent']}%")
+            self.logger.error("SRE ALERT - High error rate: %.1f%% > %s%%",
+                              latest_signals.error_rate_percent, self.sre_thresholds['error_rate_percent'])
         
         # Saturation alert
-        max_saturation = max(latest_signals.saturation_cpu_percent, latest_signals.saturation_memory_percent)
+        max_saturation = latest_signals.saturation_max_percent
         if max_saturation > self.sre_thresholds['saturation_percent']:
-            self.logger.warning(f"SRE ALERT - High resource saturation: {max_saturation:.1f}% > {self.sre_thresholds['saturation_percent']}%")
+            self.logger.warning("SRE ALERT - High resource saturation: %.1f%% > %s%%",
+                                max_saturation, self.sre_thresholds['saturation_percent'])
         
         # Traffic degradation alert (compare to recent average)
         if len(self.golden_signals_history) > 5:
-            recent_traffic = [gs.traffic_rps for gs in list(self.golden_signals_history)[-5:]]
-            avg_traffic = statistics.mean(recent_traffic)
-            if latest_signals.traffic_rps < avg_traffic * self.sre_thresholds['traffic_degradation']:
-                self.logger.warning(f"SRE ALERT - Traffic degradation: {latest_signals.traffic_rps:.1f} RPS < {avg_traffic * self.sre_thresholds['traffic_degradation']:.1f} RPS")
+            recent_traffic = [gs.traffic_rps for gs in islice(reversed(self.golden_signals_history), 5)]
+            traffic_floor = _mean(recent_traffic) * self.sre_thresholds['traffic_degradation']
+            if latest_signals.traffic_rps < traffic_floor:
+                self.logger.warning("SRE ALERT - Traffic degradation: %.1f RPS < %.1f RPS",
+                                    latest_signals.traffic_rps, traffic_floor)
     
     def get_sre_golden_signals(self) -> Dict:
         """Get current Google SRE Golden Signals"""
@@ -254,26 +455,14 @@ class PerformanceMonitor:
         
         latest = self.golden_signals_history[-1]
         
-        # Calculate trends (last 5 snapshots)
-        recent_signals = list(self.golden_signals_history)[-5:] if len(self.golden_signals_history) >= 5 else list(self.golden_signals_history)
-        
-        latency_trend = 'stable'
-        if len(recent_signals) >= 3:
-            first_latency = recent_signals[0].latency_p95_ms
-            last_latency = recent_signals[-1].latency_p95_ms
-            if last_latency > first_latency * 1.2:
-                latency_trend = 'increasing'
-            elif last_latency < first_latency * 0.8:
-                latency_trend = 'decreasing'
-        
-        traffic_trend = 'stable'
-        if len(recent_signals) >= 3:
-            first_traffic = recent_signals[0].traffic_rps
-            last_traffic = recent_signals[-1].traffic_rps
-            if last_traffic > first_traffic * 1.2:
-                traffic_trend = 'increasing'
-            elif last_traffic < first_traffic * 0.8:
-                traffic_trend = 'decreasing'
+        # Trends and the health score derive only from the snapshot history, so they are
+        # recomputed only when a new snapshot has been appended since the last call.
+        # The report dicts are built fresh on every call - callers own what they get
+        cached_snapshot, snapshot_values = self._golden_signals_cache
+        if cached_snapshot is not latest:
+            snapshot_values = self._golden_signals_trends() + (self._calculate_sre_health_score(latest),)
+            self._golden_signals_cache = (latest, snapshot_values)
+        latency_trend, traffic_trend, sre_health_score = snapshot_values
         
         return {
             'golden_signals': {
@@ -296,16 +485,41 @@ class PerformanceMonitor:
                 'saturation': {
                     'cpu_percent': latest.saturation_cpu_percent,
                     'memory_percent': latest.saturation_memory_percent,
-                    'max_saturation': max(latest.saturation_cpu_percent, latest.saturation_memory_percent),
-                    'alert': max(latest.saturation_cpu_percent, latest.saturation_memory_percent) > self.sre_thresholds['saturation_percent']
+                    'max_saturation': latest.saturation_max_percent,
+                    'alert': latest.saturation_max_percent > self.sre_thresholds['saturation_percent']
                 }
             },
             'service_metrics': self.service_metrics.copy(),
-            'sre_health_score': self._calculate_sre_health_score(latest),
+            'sre_health_score': sre_health_score,
             'production_issue_detection': self._calculate_issue_detection_capability(),
             'timestamp': latest.timestamp
         }
     
+    def _golden_signals_trends(self) -> Tuple[str, str]:
+        """Latency and traffic trends over the last 5 snapshots"""
+        
+        recent_signals = list(islice(reversed(self.golden_signals_history), 5))[::-1]
+        
+        latency_trend = 'stable'
+        if len(recent_signals) >= 3:
+            first_latency = recent_signals[0].latency_p95_ms
+            last_latency = recent_signals[-1].latency_p95_ms
+            if last_latency > first_latency * 1.2:
+                latency_trend = 'increasing'
+            elif last_latency < first_latency * 0.8:
+                latency_trend = 'decreasing'
+        
+        traffic_trend = 'stable'
+        if len(recent_signals) >= 3:
+            first_traffic = recent_signals[0].traffic_rps
+            last_traffic = recent_signals[-1].traffic_rps
+            if last_traffic > first_traffic * 1.2:
+                traffic_trend = 'increasing'
+            elif last_traffic < first_traffic * 0.8:
+                traffic_trend = 'decreasing'
+        
+        return latency_trend, traffic_trend
+    
     def _calculate_sre_health_score(self, signals: SREGoldenSignals) -> float:
         """Calculate overall SRE health score (0-100)"""
         
@@ -316,7 +530,7 @@ class PerformanceMonitor:
         error_health = max(0, 100 - (signals.error_rate_percent / self.sre_thresholds['error_rate_percent']) * 100)
         
         # Saturation health (inverse of max saturation)
-        max_saturation = max(signals.saturation_cpu_percent, signals.saturation_memory_percent)
+        max_saturation = signals.saturation_max_percent
         saturation_health = max(0, 100 - (max_saturation / self.sre_thresholds['saturation_percent']) * 100)
         
         # Traffic health (always 100 unless severe degradation)
@@ -335,20 +549,12 @@ class PerformanceMonitor:
     def _calculate_issue_detection_capability(self) -> Dict:
         """Calculate production issue detection capability (target: 80%)"""
         
-        # Based on Google SRE research, the 4 Golden Signals can detect ~80% of production issues
-        detection_categories = {
-            'performance_issues': 90,    # Latency + Saturation signals
-            'availability_issues': 85,   # Error rate + Traffic signals
-            'capacity_issues': 80,       # Saturation + Traffic signals
-            'user_experience_issues': 75 # Latency + Error rate signals
-        }
-        
-        overall_detection = statistics.mean(detection_categories.values())
+        overall_detection = self._OVERALL_DETECTION
         
         return {
             'overall_detection_percentage': overall_detection,
             'meets_80_percent_target': overall_detection >= 80,
-            'detection_by_category': detection_categories,
+            'detection_by_category': dict(self._DETECTION_CATEGORIES),
             'monitoring_coverage': {
                 'golden_signals_active': len(self.golden_signals_history) > 0,
                 'service_metrics_tracked': len(self.service_metrics) == 3,
@@ -359,36 +565,43 @@ class PerformanceMonitor:
     def _meets_performance_target(self, metrics: PerformanceMetrics) -> bool:
         """Check if metrics meet performance targets (existing functionality preserved)"""
         
-        # Determine target based on complexity
-        if metrics.complexity_score < 0.4:
-            target_ms = self.targets['simple_task_ms']
-        elif metrics.complexity_score < 0.7:
-            target_ms = self.targets['standard_task_ms']
+        return metrics.decision_time_ms <= self._target_ms(metrics.complexity_score)
+    
+    def _target_ms(self, complexity_score: float) -> float:
+        """Response time target for a complexity score"""
+        
+        if complexity_score < 0.4:
+            return self.targets['simple_task_ms']
+        elif complexity_score < 0.7:
+            return self.targets['standard_task_ms']
         else:
-            target_ms = self.targets['complex_task_ms']
-            
-        return metrics.decision_time_ms <= target_ms
+            return self.targets['complex_task_ms']
     
     def _check_performance_alerts(self, metrics: PerformanceMetrics):
         """Check if current performance triggers alerts (existing functionality preserved)"""
         
+        # Runs on every request, so messages use lazy %-style formatting and are only
+        # built when the logger is enabled for the level
+        logger = self.logger
+        
         # Alert on individual slow responses
-        if metrics.decision_time_ms > 300:  # 300ms threshold
-            self.logger.warning(f"Slow routing decision: {metrics.decision_time_ms:.1f}ms")
+        if (metrics.decision_time_ms > self.alert_thresholds['slow_decision_ms']
+                and logger.isEnabledFor(logging.WARNING)):
+            logger.warning("Slow routing decision: %.1fms", metrics.decision_time_ms)
             
         # Alert on failed routing
-        if not metrics.success:
-            self.logger.error(f"Routing failure - Action: {metrics.action}, Confidence: {metrics.confidence}")
+        if not metrics.success and logger.isEnabledFor(logging.ERROR):
+            logger.error("Routing failure - Action: %s, Confidence: %s", metrics.action, metrics.confidence)
     
     def generate_performance_report(self, time_window_hours: int = 24) -> Dict:
         """Generate comprehensive performance report (existing functionality preserved with SRE enhancements)"""
         
-        if not self.metrics_history:
+        if not self.metric_timestamps:
             return {'error': 'No performance data available'}
             
         # Filter recent data
         cutoff_time = time.time() - (time_window_hours * 3600)
-        recent_metrics = [m for m in self.metrics_history if m.timestamp > cutoff_time]
+        recent_metrics = self._window(cutoff_time)
         
         if not recent_metrics:
             return {'error': f'No data available for {time_window_hours}h window'}
@@ -410,139 +623,162 @@ class PerformanceMonitor:
         
         return base_report
     
-    def _generate_performance_summary(self, metrics: List[PerformanceMetrics]) -> Dict:
+    def _generate_performance_summary(self, metrics: MetricsWindow) -> Dict:
         """Generate high-level performance summary (existing functionality preserved)"""
         
-        response_times = [m.decision_time_ms for m in metrics]
-        successful = sum(1 for m in metrics if m.success)
-        cache_hits = sum(1 for m in metrics if m.cache_hit)
+        response_times = metrics.response_times
+        response_stats = self._response_time_stats(metrics)
+        target_ms = self._target_ms
         
         return {
             'total_requests': len(metrics),
-            'success_rate': successful / len(metrics),
-            'avg_response_time_ms': statistics.mean(response_times),
-            'median_response_time_ms': statistics.median(response_times),
-            'cache_hit_rate': cache_hits / len(metrics),
+            'success_rate': metrics.success_count / len(metrics),
+            'avg_response_time_ms': response_stats.mean,
+            'median_response_time_ms': response_stats.median,
+            'cache_hit_rate': metrics.cache_hit_count / len(metrics),
             'requests_per_hour': len(metrics) / 24,  # Assuming 24h window
-            'target_achievement_rate': sum(1 for m in metrics if self._meets_performance_target(m)) / len(metrics)
+            'target_achievement_rate': sum(1 for response_time, complexity in zip(response_times, metrics.complexity_scores)
+                                           if response_time <= target_ms(complexity)) / len(metrics)
         }
     
-    def _analyze_response_times(self, metrics: List[PerformanceMetrics]) -> Dict:
+    def _analyze_response_times(self, metrics: MetricsWindow) -> Dict:
         """Analyze response time distribution and percentiles (existing functionality preserved)"""
         
-        response_times = [m.decision_time_ms for m in metrics]
+        response_times = metrics.response_times
+        response_stats = self._response_time_stats(metrics)
+        
+        # Per-bucket requests meeting the 50/100/200ms targets
+        complexity_bucket = self._complexity_bucket
+        within_target = [0, 0, 0]
+        for complexity, response_time in zip(metrics.complexity_scores, response_times):
+            bucket = complexity_bucket(complexity)
+            if response_time <= (50, 100, 200)[bucket]:
+                within_target[bucket] += 1
+        simple_count, standard_count, complex_count = metrics.complexity_counts
         
         return {
-            'avg_response_time_ms': statistics.mean(response_times),
-            'p50_response_time_ms': statistics.median(response_times),
-            'p95_response_time_ms': self._percentile(response_times, 95),
-            'p99_response_time_ms': self._percentile(response_times, 99),
-            'max_response_time_ms': max(response_times),
-            'min_response_time_ms': min(response_times),
-            'std_deviation_ms': statistics.stdev(response_times) if len(response_times) > 1 else 0,
+            'avg_response_time_ms': response_stats.mean,
+            'p50_response_time_ms': response_stats.median,
+            'p95_response_time_ms': response_stats.p95,
+            'p99_response_time_ms': response_stats.p99,
+            'max_response_time_ms': response_stats.maximum,
+            'min_response_time_ms': response_stats.minimum,
+            'std_deviation_ms': response_stats.std_deviation,
             'target_compliance': {
-                'simple_tasks': sum(1 for m in metrics 
-                                  if m.complexity_score < 0.4 and m.decision_time_ms <= 50) / 
-                               max(sum(1 for m in metrics if m.complexity_score < 0.4), 1),
-                'standard_tasks': sum(1 for m in metrics 
-                                    if 0.4 <= m.complexity_score < 0.7 and m.decision_time_ms <= 100) / 
-                                 max(sum(1 for m in metrics if 0.4 <= m.complexity_score < 0.7), 1),
-                'complex_tasks': sum(1 for m in metrics 
-                                   if m.complexity_score >= 0.7 and m.decision_time_ms <= 200) / 
-                                max(sum(1 for m in metrics if m.complexity_score >= 0.7), 1)
+                'simple_tasks': within_target[0] / max(simple_count, 1),
+                'standard_tasks': within_target[1] / max(standard_count, 1),
+                'complex_tasks': within_target[2] / max(complex_count, 1)
             }
         }
     
-    def _analyze_success_rates(self, metrics: List[PerformanceMetrics]) -> Dict:
+    def _analyze_success_rates(self, metrics: MetricsWindow) -> Dict:
         """Analyze routing success rates by category (existing functionality preserved)"""
         
-        # Group by action type
+        # Group by action code: code -> [requests, successes]
         by_action = {}
-        for metric in metrics:
-            if metric.action not in by_action:
-                by_action[metric.action] = []
-            by_action[metric.action].append(metric)
-        
-        action_success_rates = {}
-        for action, action_metrics in by_action.items():
-            successful = sum(1 for m in action_metrics if m.success)
-            action_success_rates[action] = successful / len(action_metrics)
+        for action_code, success in zip(metrics.actions, metrics.successes):
+            counts = by_action.get(action_code)
+            if counts is None:
+                counts = by_action[action_code] = [0, 0]
+            counts[0] += 1
+            counts[1] += success
+        
+        action_values = self._action_values
+        action_success_rates = {action_values[action_code]: successful / total
+                                for action_code, (total, successful) in by_action.items()}
+        
+        complexity_bucket = self._complexity_bucket
+        successful_by_bucket = [0, 0, 0]
+        for complexity, success in zip(metrics.complexity_scores, metrics.successes):
+            if success:
+                successful_by_bucket[complexity_bucket(complexity)] += 1
+        simple_count, standard_count, complex_count = metrics.complexity_counts
         
         return {
-            'overall_success_rate': sum(1 for m in metrics if m.success) / len(metrics),
+            'overall_success_rate': metrics.success_count / len(metrics),
             'success_by_action': action_success_rates,
             'success_by_complexity': {
-                'simple': sum(1 for m in metrics if m.complexity_score < 0.4 and m.success) / 
-                         max(sum(1 for m in metrics if m.complexity_score < 0.4), 1),
-                'standard': sum(1 for m in metrics if 0.4 <= m.complexity_score < 0.7 and m.success) / 
-                           max(sum(1 for m in metrics if 0.4 <= m.complexity_score < 0.7), 1),
-                'complex': sum(1 for m in metrics if m.complexity_score >= 0.7 and m.success) / 
-                          max(sum(1 for m in metrics if m.complexity_score >= 0.7), 1)
+                'simple': successful_by_bucket[0] / max(simple_count, 1),
+                'standard': successful_by_bucket[1] / max(standard_count, 1),
+                'complex': successful_by_bucket[2] / max(complex_count, 1)
             }
         }
     
-    def _analyze_cache_performance(self, metrics: List[PerformanceMetrics]) -> Dict:
+    def _analyze_cache_performance(self, metrics: MetricsWindow) -> Dict:
         """Analyze cache hit rates and performance impact (existing functionality preserved)"""
         
-        cache_hits = [m for m in metrics if m.cache_hit]
-        cache_misses = [m for m in metrics if not m.cache_hit]
+        hit_times = []
+        miss_times = []
+        for cache_hit, response_time in zip(metrics.cache_hits, metrics.response_times):
+            (hit_times if cache_hit else miss_times).append(response_time)
         
-        cache_hit_response_time = statistics.mean([m.decision_time_ms for m in cache_hits]) if cache_hits else 0
-        cache_miss_response_time = statistics.mean([m.decision_time_ms for m in cache_misses]) if cache_misses else 0
+        cache_hit_response_time = _mean(hit_times) if hit_times else 0
+        cache_miss_response_time = _mean(miss_times) if miss_times else 0
         
         return {
-            'cache_hit_rate': len(cache_hits) / len(metrics),
-            'cache_hits_count': len(cache_hits),
-            'cache_misses_count': len(cache_misses),
+            'cache_hit_rate': len(hit_times) / len(metrics),
+            'cache_hits_count': len(hit_times),
+            'cache_misses_count': len(miss_times),
             'avg_cache_hit_response_time_ms': cache_hit_response_time,
             'avg_cache_miss_response_time_ms': cache_miss_response_time,
             'cache_performance_improvement': max(0, cache_miss_response_time - cache_hit_response_time),
-            'cache_effectiveness': len(cache_hits) > 0 and cache_hit_response_time < cache_miss_response_time
+            'cache_effectiveness': len(hit_times) > 0 and cache_hit_response_time < cache_miss_response_time
         }
     
-    def _analyze_complexity_distribution(self, metrics: List[PerformanceMetrics]) -> Dict:
+    def _analyze_complexity_distribution(self, metrics: MetricsWindow) -> Dict:
         """Analyze complexity score distribution and routing patterns (existing functionality preserved)"""
         
-        simple_tasks = [m for m in metrics if m.complexity_score < 0.4]
-        standard_tasks = [m for m in metrics if 0.4 <= m.complexity_score < 0.7]
-        complex_tasks = [m for m in metrics if m.complexity_score >= 0.7]
+        complexity_bucket = self._complexity_bucket
+        times_by_bucket = ([], [], [])
+        for complexity, response_time in zip(metrics.complexity_scores, metrics.response_times):
+            times_by_bucket[complexity_bucket(complexity)].append(response_time)
+        simple_times, standard_times, complex_times = times_by_bucket
+        simple_count, standard_count, complex_count = metrics.complexity_counts
+        
+        # Domain counts are non-negative ints: two C-level list.count() scans, and
+        # everything else is multi-domain
+        no_domain = metrics.domain_counts.count(0)
+        single_domain = metrics.domain_counts.count(1)
+        multi_domain = len(metrics) - no_domain - single_domain
         
         return {
             'complexity_distribution': {
-                'simple': len(simple_tasks) / len(metrics),
-                'standard': len(standard_tasks) / len(metrics), 
-                'complex': len(complex_tasks) / len(metrics)
+                'simple': simple_count / len(metrics),
+                'standard': standard_count / len(metrics), 
+                'complex': complex_count / len(metrics)
             },
-            'avg_complexity_score': statistics.mean([m.complexity_score for m in metrics]),
+            'avg_complexity_score': _mean(metrics.complexity_scores),
             'avg_response_time_by_complexity': {
-                'simple': statistics.mean([m.decision_time_ms for m in simple_tasks]) if simple_tasks else 0,
-                'standard': statistics.mean([m.decision_time_ms for m in standard_tasks]) if standard_tasks else 0,
-                'complex': statistics.mean([m.decision_time_ms for m in complex_tasks]) if complex_tasks else 0
+                'simple': _mean(simple_times) if simple_times else 0,
+                'standard': _mean(standard_times) if standard_times else 0,
+                'complex': _mean(complex_times) if complex_times else 0
             },
             'domain_distribution': {
-                'single_domain': sum(1 for m in metrics if m.domain_count == 1) / len(metrics),
-                'multi_domain': sum(1 for m in metrics if m.domain_count > 1) / len(metrics),
-                'no_domain': sum(1 for m in metrics if m.domain_count == 0) / len(metrics)
+                'single_domain': single_domain / len(metrics),
+                'multi_domain': multi_domain / len(metrics),
+                'no_domain': no_domain / len(metrics)
             }
         }
     
-    def _identify_performance_issues(self, metrics: List[PerformanceMetrics]) -> List[Dict]:
+    def _identify_performance_issues(self, metrics: MetricsWindow) -> List[Dict]:
         """Identify performance issues and create alerts (existing functionality preserved)"""
         
         issues = []
-        recent_response_times = [m.decision_time_ms for m in metrics[-10:]]  # Last 10 requests
+        recent_response_times = metrics.response_times[-10:]  # Last 10 requests
         
         # Check average response time
-        if recent_response_times and statistics.mean(recent_response_times) > self.alert_thresholds['avg_response_time_ms']:
+        recent_avg_response_time = _mean(recent_response_times) if recent_response_times else 0
+        if recent_avg_response_time > self.alert_thresholds['avg_response_time_ms']:
             issues.append({
                 'type': 'high_response_time',
                 'severity': 'warning',
-                'message': f"Average response time ({statistics.mean(recent_response_times):.1f}ms) exceeds threshold ({self.alert_thresholds['avg_response_time_ms']}ms)",
+                'message': f"Average response time ({recent_avg_response_time:.1f}ms) exceeds threshold ({self.alert_thresholds['avg_response_time_ms']}ms)",
                 'recommendation': 'Review system load and optimize slow components'
             })
         
         # Check error rate
-        recent_failures = sum(1 for m in metrics[-50:] if not m.success)  # Last 50 requests
+        recent_successes = metrics.successes[-50:]  # Last 50 requests
+        recent_failures = len(recent_successes) - sum(recent_successes)
         error_rate = (recent_failures / min(50, len(metrics))) * 100 if metrics else 0
         
         if error_rate > self.alert_thresholds['error_rate_percent']:
@@ -554,7 +790,7 @@ class PerformanceMonitor:
             })
         
         # Check cache performance
-        recent_cache_hits = sum(1 for m in metrics[-100:] if m.cache_hit)
+        recent_cache_hits = sum(metrics.cache_hits[-100:])
         cache_hit_rate = (recent_cache_hits / min(100, len(metrics))) * 100 if metrics else 0
         
         if cache_hit_rate < self.alert_thresholds['cache_hit_rate_percent']:
@@ -567,48 +803,75 @@ class PerformanceMonitor:
         
         return issues
     
-    def _generate_recommendations(self, metrics: List[PerformanceMetrics]) -> List[str]:
+    def _generate_recommendations(self, metrics: MetricsWindow) -> List[str]:
         """Generate performance optimization recommendations (existing functionality preserved)"""
         
         recommendations = []
-        response_times = [m.decision_time_ms for m in metrics]
-        avg_response_time = statistics.mean(response_times)
+        avg_response_time = self._response_time_stats(metrics).mean
         
         # Response time recommendations
         if avg_response_time > 100:
             recommendations.append("Consider implementing response time optimization - current average exceeds 100ms")
         
         # Cache recommendations
-        cache_hit_rate = sum(1 for m in metrics if m.cache_hit) / len(metrics)
+        cache_hit_rate = metrics.cache_hit_count / len(metrics)
         if cache_hit_rate < 0.7:
             recommendations.append("Improve cache hit rate by optimizing cache keys and TTL settings")
             
         # Complexity distribution recommendations
-        complex_tasks_ratio = sum(1 for m in metrics if m.complexity_score >= 0.7) / len(metrics)
+        complex_tasks_ratio = metrics.complexity_counts[2] / len(metrics)
         if complex_tasks_ratio > 0.3:
             recommendations.append("High ratio of complex tasks - consider pre-processing or task decomposition")
         
         # Error rate recommendations
-        error_rate = 1 - (sum(1 for m in metrics if m.success) / len(metrics))
+        error_rate = 1 - (metrics.success_count / len(metrics))
         if error_rate > 0.05:
             recommendations.append("Error rate exceeds 5% - implement additional error handling and validation")
         
         return recommendations
     
-    def _percentile(self, data: List[float], percentile: int) -> float:
-        """Calculate percentile value (existing functionality preserved)"""
-        if not data:
-            return 0.0
-        
-        sorted_data = sorted(data)
-        index = (percentile / 100) * (len(sorted_data) - 1)
-        
-        if index.is_integer():
-            return sorted_data[int(index)]
-        else:
-            lower = sorted_data[int(index)]
-            upper = sorted_data[int(index) + 1]
-            return lower + (upper - lower) * (index - int(index))
+    def _response_time_stats(self, metrics: MetricsWindow) -> ResponseTimeStats:
+        """Summarize a window's response times from one sort, cached on the window"""
+        
+        if metrics.response_time_stats is None:
+            sorted_times = sorted(metrics.response_times)
+            count = len(sorted_times)
+            mean = math.fsum(sorted_times) / count
+            std_deviation = (math.sqrt(math.fsum((t - mean) ** 2 for t in sorted_times) / (count - 1))
+                             if count > 1 else 0)
+            
+            metrics.response_time_stats = ResponseTimeStats(
+                mean=mean,
+                std_deviation=std_deviation,
+                median=self._sorted_median(sorted_times),
+                p95=self._sorted_percentile(sorted_times, 95),
+                p99=self._sorted_percentile(sorted_times, 99),
+                minimum=sorted_times[0],
+                maximum=sorted_times[-1]
+            )
+        
+        return metrics.response_time_stats
+    
+    @staticmethod
+    def _sorted_median(sorted_data: List[float]) -> float:
+        """Median of already sorted, non-empty data (same as statistics.median)"""
+        middle = len(sorted_data) // 2
+        if len(sorted_data) % 2:
+            return sorted_data[middle]
+        return (sorted_data[middle - 1] + sorted_data[middle]) / 2
+    
+    @staticmethod
+    def _sorted_percentile(sorted_data: List[float], percentile: int) -> float:
+        """Linearly interpolated percentile of already sorted data"""
+        # Split the rank percentile * (n - 1) / 100 into whole index and remainder with
+        # one divmod - exact for integer percentiles, no float index to test or truncate
+        index, remainder = divmod(percentile * (len(sorted_data) - 1), 100)
+        index = int(index)
+        
+        if not remainder:
+            return sorted_data[index]
+        lower = sorted_data[index]
+        return lower + (sorted_data[index + 1] - lower) * (remainder / 100)
     
     def get_real_time_stats(self) -> Dict:
         """Get real-time performance statistics (existing functionality preserved with SRE enhancements)"""
@@ -616,10 +879,10 @@ class PerformanceMonitor:
         if not self.response_times:
             return {'status': 'no_data'}
         
-        recent_times = list(self.response_times)[-10:]  # Last 10 requests
+        recent_times = list(islice(reversed(self.response_times), 10))  # Last 10 requests, no full copy
         
         base_stats = {
-            'current_avg_response_time_ms': statistics.mean(recent_times),
+            'current_avg_response_time_ms': _mean(recent_times),
             'total_requests': self.total_requests,
             'success_rate': self.successful_routes / self.total_requests if self.total_requests > 0 else 0,
             'cache_hit_rate': self.cache_hits / self.total_requests if self.total_requests > 0 else 0,
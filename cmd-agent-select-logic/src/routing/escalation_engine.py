@@ -1,17 +1,19 @@
 # src/routing/escalation_engine.py
 import time
 import re
+from collections.abc import Mapping
+from functools import cached_property
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
+from ..core.models import (
+    EscalationAction, AGENT_ORCH_TASKS, AGENT_ORCH_AGENTS, AGENT_ORCH_ADV, AGENT_ORGANIZER
+)
 
-class EscalationAction(Enum):
-    """Escalation decision outcomes"""
-    DIRECT_AGENT_ROUTING = "DIRECT_AGENT_ROUTING"
-    ORCHESTRATION_ROUTING = "ORCHESTRATION_ROUTING" 
-    ESCALATE_TO_ORGANIZER = "ESCALATE_TO_ORGANIZER"
+# Trigger flags in reporting order; the attribute name doubles as its label
+_TRIGGER_NAMES = ('low_confidence', 'high_complexity', 'multi_domain',
+                  'enterprise_scope', 'architectural_decisions', 'ambiguous_requirements')
 
-@dataclass
+@dataclass(frozen=True)
 class EscalationTriggers:
     """Escalation trigger analysis results"""
     low_confidence: bool
@@ -20,36 +22,69 @@ class EscalationTriggers:
     enterprise_scope: bool
     architectural_decisions: bool
     ambiguous_requirements: bool
+    # Names of the active triggers, computed once and shared by every consumer
+    names: List[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'names', [name for name in _TRIGGER_NAMES if getattr(self, name)])
 
 @dataclass
 class EscalationDecision:
     """Complete escalation decision with context"""
+    # Built on every escalation check; fixed slots skip the per-instance __dict__
+    # (dataclass(slots=True) needs Python 3.10; no field has a default, so this is safe)
+    __slots__ = ('action', 'reason', 'confidence', 'escalation_score', 'triggers',
+                 'recommended_agent', 'context_package')
+    
     action: EscalationAction
     reason: str
     confidence: float
     escalation_score: float
     triggers: List[str]
     recommended_agent: Optional[str]
-    context_package: Optional[Dict]
+    context_package: Optional[Mapping]
 
-class OrganizeContextPackage:
-    """Context package builder for @agent-organizer handoff"""
+class OrganizeContextPackage(Mapping):
+    """Context package for @agent-organizer handoff
     
-    @staticmethod
-    def create_context_package(task_description: str, 
-                             task_analysis: Dict,
-                             domain_analysis: Dict,
-                             confidence_analysis: Dict,
-                             available_agents: List[str],
-                             escalation_triggers: EscalationTriggers) -> Dict:
-        """Build comprehensive context package for strategic analysis"""
+    Holds the routing inputs by reference and builds the nested package on first
+    read, so escalations whose package is never inspected skip the assembly.
+    """
+    
+    def __init__(self, task_description: str,
+                 task_analysis: Dict,
+                 domain_analysis: Dict,
+                 confidence_analysis: Dict,
+                 available_agents: List[str],
+                 escalation_triggers: EscalationTriggers):
+        self.task_description = task_description
+        self.task_analysis = task_analysis
+        self.domain_analysis = domain_analysis
+        self.confidence_analysis = confidence_analysis
+        self.available_agents = available_agents
+        self.escalation_triggers = escalation_triggers
+        # Stamped now - the package records when escalation happened, not when it was read
+        self.escalation_timestamp = time.time()
+    
+    @cached_property
+    def escalation_reason(self) -> str:
+        return OrganizeContextPackage._generate_escalation_reason(self.escalation_triggers)
+    
+    @cached_property
+    def _package(self) -> Dict:
+        task_analysis = self.task_analysis
+        domain_analysis = self.domain_analysis
+        confidence_analysis = self.confidence_analysis
+        escalation_triggers = self.escalation_triggers
         
         return {
-            'original_request': task_description,
+            'original_request': self.task_description,
             'routing_analysis': {
                 'complexity_score': task_analysis.get('complexity_score', 0.5),
                 'complexity_level': task_analysis.get('complexity_level', 'STANDARD'),
                 'domains_detected': domain_analysis.get('domains', []),
+                'domain_names': domain_analysis.get('domain_names') or
+                                [d['domain'] for d in domain_analysis.get('domains', [])],
                 'primary_domain': domain_analysis.get('primary_domain'),
                 'domain_count': domain_analysis.get('domain_count', 0),
                 'confidence_breakdown': {
@@ -59,11 +94,11 @@ class OrganizeContextPackage:
                     'context_completeness': confidence_analysis.get('context_completeness', 0.5),
                     'resource_availability': confidence_analysis.get('resource_availability', 0.5)
                 },
-                'escalation_triggers': OrganizeContextPackage._extract_trigger_names(escalation_triggers)
+                'escalation_triggers': escalation_triggers.names
             },
             'system_context': {
-                'available_agents': available_agents,
-                'agent_count': len(available_agents),
+                'available_agents': self.available_agents,
+                'agent_count': len(self.available_agents),
                 'resource_constraints': OrganizeContextPackage._assess_resource_constraints(),
                 'performance_requirements': OrganizeContextPackage._estimate_performance_needs(task_analysis)
             },
@@ -74,27 +109,36 @@ class OrganizeContextPackage:
                 'complexity_management_needed': escalation_triggers.high_complexity
             },
             'expected_deliverable': 'Strategic analysis with agent team recommendations and execution plan',
-            'escalation_timestamp': time.time(),
-            'escalation_reason': OrganizeContextPackage._generate_escalation_reason(escalation_triggers)
+            'escalation_timestamp': self.escalation_timestamp,
+            'escalation_reason': self.escalation_reason
         }
     
+    def __getitem__(self, key: str):
+        return self._package[key]
+    
+    def __iter__(self):
+        return iter(self._package)
+    
+    def __len__(self) -> int:
+        return len(self._package)
+    
+    def as_dict(self) -> Dict:
+        """Plain-dict copy of the package, e.g. for serialization"""
+        return dict(self._package)
+    
     @staticmethod
-    def _extract_trigger_names(triggers: EscalationTriggers) -> List[str]:
-        """Extract names of active triggers"""
-        active_triggers = []
-        if triggers.low_confidence:
-            active_triggers.append('low_confidence')
-        if triggers.high_complexity:
-            active_triggers.append('high_complexity') 
-        if triggers.multi_domain:
-            active_triggers.append('multi_domain')
-        if triggers.enterprise_scope:
-            active_triggers.append('enterprise_scope')
-        if triggers.architectural_decisions:
-            active_triggers.append('architectural_decisions')
-        if triggers.ambiguous_requirements:
-            active_triggers.append('ambiguous_requirements')
-        return active_triggers
+    def create_context_package(task_description: str, 
+                             task_analysis: Dict,
+                             domain_analysis: Dict,
+                             confidence_analysis: Dict,
+                             available_agents: List[str],
+                             escalation_triggers: EscalationTriggers) -> Dict:
+        """Build comprehensive context package for strategic analysis"""
+        
+        return OrganizeContextPackage(
+            task_description, task_analysis, domain_analysis,
+            confidence_analysis, available_agents, escalation_triggers
+        ).as_dict()
     
     @staticmethod
     def _assess_resource_constraints() -> Dict:
@@ -141,6 +185,9 @@ class OrganizeContextPackage:
 class StrategicEscalationEngine:
     """Research-based escalation decision engine with @agent-organizer integration"""
     
+    # Intelligent analysis, standard coordination, enterprise coordination
+    _ORCHESTRATION_TIERS = (AGENT_ORCH_TASKS, AGENT_ORCH_AGENTS, AGENT_ORCH_ADV)
+    
     def __init__(self):
         self.enterprise_keywords = {
             'scale_indicators': ['enterprise', 'large-scale', 'system-wide', 'comprehensive', 
@@ -159,29 +206,51 @@ class StrategicEscalationEngine:
                                 'compare', 'assess', 'analyze']
         }
         
+        # Keyword categories matched as substrings (so 'manage' also hits
+        # 'management'), each compiled into one alternation over lowercased text
+        self._enterprise_re = self._keyword_union(
+            kw for keywords in self.enterprise_keywords.values() for kw in keywords)
+        self._design_re = self._keyword_union(self.architectural_keywords['design_patterns'])
+        self._system_design_re = self._keyword_union(self.architectural_keywords['system_design'])
+        # Zero-width lookahead reports every keyword at every position, so distinct
+        # decision keywords are counted exactly even where occurrences overlap
+        self._decision_re = re.compile('(?=(%s))' % '|'.join(
+            map(re.escape, self.architectural_keywords['decision_keywords'])))
+        
         self.ambiguity_patterns = [
             r'\b(maybe|perhaps|might|could|should)\b',
             r'\b(not sure|unclear|vague|ambiguous)\b',
             r'\?.*\?',  # Multiple question marks
             r'\b(what|how|which|where|when|why)\b.*\b(what|how|which|where|when|why)\b'  # Multiple questions
         ]
+        # Compiled once; patterns stay separate because their matches may overlap
+        # (e.g. "should" inside a "what ... how" span) and each one counts on its own
+        self._ambiguity_res = tuple(re.compile(pattern, re.IGNORECASE)
+                                    for pattern in self.ambiguity_patterns)
+    
+    @staticmethod
+    def _keyword_union(keywords) -> re.Pattern:
+        """Compile literal keywords into a single alternation regex"""
+        return re.compile('|'.join(map(re.escape, keywords)))
     
     def analyze_escalation_triggers(self, task_description: str,
                                   complexity_score: float,
-                                  domain_analysis: Dict,
-                                  confidence_analysis: Dict) -> EscalationTriggers:
+                                  domain_count: int,
+                                  total_confidence: float,
+                                  task_lower: Optional[str] = None) -> EscalationTriggers:
         """Analyze all escalation trigger conditions"""
         
-        task_lower = task_description.lower()
+        if task_lower is None:
+            task_lower = task_description.lower()
         
         # Trigger 1: Low confidence (<0.4)
-        low_confidence = confidence_analysis.get('total_confidence', 0.5) < 0.4
+        low_confidence = total_confidence < 0.4
         
         # Trigger 2: High complexity (>0.8)
         high_complexity = complexity_score > 0.8
         
         # Trigger 3: Multi-domain (>3 domains)
-        multi_domain = domain_analysis.get('domain_count', 0) > 3
+        multi_domain = domain_count > 3
         
         # Trigger 4: Enterprise scope
         enterprise_scope = self._check_enterprise_indicators(task_lower)
@@ -204,56 +273,49 @@ class StrategicEscalationEngine:
     def _check_enterprise_indicators(self, task_description: str) -> bool:
         """Check for enterprise-scale indicators"""
         
-        for category, keywords in self.enterprise_keywords.items():
-            if any(keyword in task_description for keyword in keywords):
-                return True
-        return False
+        return self._enterprise_re.search(task_description) is not None
     
     def _check_architectural_keywords(self, task_description: str) -> bool:
         """Check for architectural decision keywords"""
         
-        design_matches = sum(1 for keyword in self.architectural_keywords['design_patterns']
-                           if keyword in task_description)
-        system_matches = sum(1 for keyword in self.architectural_keywords['system_design']
-                           if keyword in task_description)
-        decision_matches = sum(1 for keyword in self.architectural_keywords['decision_keywords']
-                             if keyword in task_description)
-        
         # Architectural indicators if multiple categories match
-        return (design_matches > 0 and system_matches > 0) or decision_matches > 1
+        if (self._design_re.search(task_description) is not None and
+                self._system_design_re.search(task_description) is not None):
+            return True
+        return len(set(self._decision_re.findall(task_description))) > 1
     
     def _assess_requirement_ambiguity(self, task_description: str) -> bool:
         """Assess if requirements are ambiguous"""
         
+        # Consider ambiguous if multiple ambiguity patterns detected - stop scanning
+        # as soon as the threshold is crossed
         ambiguity_score = 0
-        for pattern in self.ambiguity_patterns:
-            matches = len(re.findall(pattern, task_description, re.IGNORECASE))
-            ambiguity_score += matches
-        
-        # Consider ambiguous if multiple ambiguity patterns detected
-        return ambiguity_score > 2
+        for pattern_re in self._ambiguity_res:
+            for _ in pattern_re.finditer(task_description):
+                ambiguity_score += 1
+                if ambiguity_score > 2:
+                    return True
+        return False
     
-    def calculate_escalation_score(self, complexity_score: float,
-                                 domain_analysis: Dict,
-                                 confidence_analysis: Dict,
+    @staticmethod
+    def calculate_escalation_score(complexity_score: float,
+                                 domain_count: int,
+                                 total_confidence: float,
                                  escalation_triggers: EscalationTriggers) -> float:
         """Calculate research-based escalation score"""
         
-        # Research-based escalation formula
+        # Research-based escalation formula plus trigger bonuses in one expression.
+        # The weighted terms keep their original grouping so scores stay bit-identical
+        # around the 0.7 escalation threshold
         escalation_score = (
-            (1.0 - confidence_analysis.get('total_confidence', 0.5)) * 0.4 +
+            (1.0 - total_confidence) * 0.4 +
             complexity_score * 0.3 +
-            (domain_analysis.get('domain_count', 0) / 5.0) * 0.2 +
-            (1.0 if escalation_triggers.ambiguous_requirements else 0.0) * 0.1
+            (domain_count / 5.0) * 0.2 +
+            (0.1 if escalation_triggers.ambiguous_requirements else 0.0) +
+            (0.2 if escalation_triggers.enterprise_scope else 0.0) +
+            (0.15 if escalation_triggers.architectural_decisions else 0.0)
         )
-        
-        # Bonus escalation for specific triggers
-        if escalation_triggers.enterprise_scope:
-            escalation_score += 0.2
-        if escalation_triggers.architectural_decisions:
-            escalation_score += 0.15
-        
-        return min(escalation_score, 1.0)
+        return escalation_score if escalation_score < 1.0 else 1.0
     
     def make_escalation_decision(self, task_description: str,
                                task_analysis: Dict,
@@ -262,16 +324,21 @@ class StrategicEscalationEngine:
                                available_agents: List[str]) -> EscalationDecision:
         """Make comprehensive escalation decision with context"""
         
+        # Read each input once; everything below works on these locals
         complexity_score = task_analysis.get('complexity_score', 0.5)
+        domain_count = domain_analysis.get('domain_count', 0)
+        total_confidence = confidence_analysis.get('total_confidence', 0.5)
         
         # Analyze escalation triggers
+        # Domain detection already lowercased the description
         triggers = self.analyze_escalation_triggers(
-            task_description, complexity_score, domain_analysis, confidence_analysis
+            task_description, complexity_score, domain_count, total_confidence,
+            domain_analysis.get('task_lower')
         )
         
         # Calculate escalation score
         escalation_score = self.calculate_escalation_score(
-            complexity_score, domain_analysis, confidence_analysis, triggers
+            complexity_score, domain_count, total_confidence, triggers
         )
         
         # Make decision based on research-based thresholds
@@ -281,29 +348,27 @@ class StrategicEscalationEngine:
                 reason="Strategic analysis required",
                 confidence=escalation_score,
                 escalation_score=escalation_score,
-                triggers=OrganizeContextPackage._extract_trigger_names(triggers),
-                recommended_agent="@agent-organizer",
-                context_package=OrganizeContextPackage.create_context_package(
+                triggers=triggers.names,
+                recommended_agent=AGENT_ORGANIZER,
+                context_package=OrganizeContextPackage(
                     task_description, task_analysis, domain_analysis, 
                     confidence_analysis, available_agents, triggers
                 )
             )
         
-        elif (domain_analysis.get('domain_count', 0) >= 2 and 
-              confidence_analysis.get('total_confidence', 0.5) > 0.6):
+        elif domain_count >= 2 and total_confidence > 0.6:
             
             # Multi-agent coordination needed
             orchestration_type = self._determine_orchestration_type(
-                domain_analysis.get('domain_count', 0), complexity_score,
-                confidence_analysis.get('total_confidence', 0.5)
+                domain_count, complexity_score, total_confidence
             )
             
             return EscalationDecision(
                 action=EscalationAction.ORCHESTRATION_ROUTING,
                 reason="Multi-agent coordination needed",
-                confidence=confidence_analysis.get('total_confidence', 0.5),
+                confidence=total_confidence,
                 escalation_score=escalation_score,
-                triggers=OrganizeContextPackage._extract_trigger_names(triggers),
+                triggers=triggers.names,
                 recommended_agent=orchestration_type,
                 context_package=None
             )
@@ -315,9 +380,9 @@ class StrategicEscalationEngine:
             return EscalationDecision(
                 action=EscalationAction.DIRECT_AGENT_ROUTING,
                 reason="Single agent capable",
-                confidence=confidence_analysis.get('total_confidence', 0.5),
+                confidence=total_confidence,
                 escalation_score=escalation_score,
-                triggers=OrganizeContextPackage._extract_trigger_names(triggers),
+                triggers=triggers.names,
                 recommended_agent=recommended_agent,
                 context_package=None
             )
@@ -327,12 +392,11 @@ class StrategicEscalationEngine:
                                     confidence: float) -> str:
         """Select appropriate orchestration system"""
         
-        if domain_count >= 4 or complexity_score > 0.8:
-            return "@orchestrate-agents-adv"  # Enterprise coordination
-        elif domain_count >= 2 or complexity_score > 0.5:
-            return "@orchestrate-agents"      # Standard coordination  
-        else:
-            return "@orchestrate-tasks"       # Intelligent analysis
+        # Enterprise coordination implies standard coordination, so the number of
+        # conditions met indexes the tier directly
+        tier = ((domain_count >= 4 or complexity_score > 0.8) +
+                (domain_count >= 2 or complexity_score > 0.5))
+        return self._ORCHESTRATION_TIERS[tier]
     
     def _select_direct_agent(self, domain_analysis: Dict, 
                            available_agents: List[str]) -> str:
@@ -340,16 +404,18 @@ class StrategicEscalationEngine:
         
         domains = domain_analysis.get('domains', [])
         if not domains:
-            return "@orchestrate-tasks"  # Safe fallback
+            return AGENT_ORCH_TASKS  # Safe fallback
         
         # Use highest confidence domain
         primary_domain = domains[0]
         preferred_agents = primary_domain.get('preferred_agents', [])
         
-        # Find first available preferred agent
+        # Find first available preferred agent - the roster is a caller-owned list that
+        # may change between calls, so its set view is built fresh for each decision
+        available_set = frozenset(available_agents)
         for agent in preferred_agents:
-            if agent in available_agents:
+            if agent in available_set:
                 return agent
         
         # Fallback to orchestration
-        return "@orchestrate-tasks"
\ No newline at end of file
+        return AGENT_ORCH_TASKS
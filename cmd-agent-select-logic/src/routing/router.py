@@ -1,28 +1,53 @@
 # src/routing/router.py
+import re
 import time
-from typing import Dict, List, Optional
-from ..core.models import RoutingDecision, RoutingAction, TaskAnalysis
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+from ..core.models import (
+    RoutingDecision, RoutingAction, TaskAnalysis,
+    AGENT_ORCH_TASKS, AGENT_ORCH_AGENTS, AGENT_ORCH_ADV,
+    AGENT_BUILD_FRONTEND, AGENT_BUILD_BACKEND, AGENT_SECURITY_AUDITOR,
+    AGENT_DEPLOY_APPLICATION, AGENT_TEST_AUTOMATION, AGENT_GENERATE_DOCUMENTATION
+)
 from ..analysis.domain_detector import DomainDetectionEngine
 
 class BasicRoutingEngine:
-    def __init__(self):
+    # Orchestration systems by tier: general task, standard and enterprise coordination
+    _ORCHESTRATION_TIERS = (AGENT_ORCH_TASKS, AGENT_ORCH_AGENTS, AGENT_ORCH_ADV)
+    
+    # Routing counter bumped by each decision path, by action
+    _ACTION_STATS = {
+        RoutingAction.DIRECT_AGENT: 'direct_routes',
+        RoutingAction.ORCHESTRATION: 'orchestration_routes',
+        RoutingAction.ESCALATE: 'escalations'
+    }
+    
+    def __init__(self, timing_enabled: bool = True, timing_sample_rate: int = 1,
+                 decision_cache_max_entries: int = 1024):
         self.domain_detector = DomainDetectionEngine()
         
+        # Per-request timing: disabled entirely, or taken on every Nth request;
+        # untimed decisions report analysis_time_ms = 0
+        if timing_sample_rate < 1:
+            raise ValueError("timing_sample_rate must be >= 1")
+        self._timing_enabled = timing_enabled
+        self._timing_sample_rate = timing_sample_rate
+        
         # High-confidence agent mappings for direct routing
         self.agent_mappings = {
-            'frontend': '@build-frontend',
-            'backend': '@build-backend', 
-            'security': '@security-auditor',
-            'infrastructure': '@deploy-application',
-            'testing': '@test-automation',
-            'documentation': '@generate-documentation'
+            'frontend': AGENT_BUILD_FRONTEND,
+            'backend': AGENT_BUILD_BACKEND, 
+            'security': AGENT_SECURITY_AUDITOR,
+            'infrastructure': AGENT_DEPLOY_APPLICATION,
+            'testing': AGENT_TEST_AUTOMATION,
+            'documentation': AGENT_GENERATE_DOCUMENTATION
         }
         
         # Orchestration system selection based on complexity and domain count
         self.orchestration_mappings = {
-            'simple': '@orchestrate-tasks',      # Single domain, low complexity
-            'standard': '@orchestrate-agents',   # 2-3 domains, medium complexity
-            'complex': '@orchestrate-agents-adv' # 4+ domains, high complexity
+            'simple': AGENT_ORCH_TASKS,     # Single domain, low complexity
+            'standard': AGENT_ORCH_AGENTS,  # 2-3 domains, medium complexity
+            'complex': AGENT_ORCH_ADV       # 4+ domains, high complexity
         }
         
         # Performance tracking
@@ -31,166 +56,316 @@ class BasicRoutingEngine:
             'direct_routes': 0,
             'orchestration_routes': 0,
             'escalations': 0,
-            'avg_response_time_ms': 0
+            'cache_hits': 0
         }
+        # Running total of analysis time over timed requests; the average is divided out on read
+        self._response_time_sum_ms = 0.0
+        self._timed_requests = 0
+        
+        # Decision paths resolved by table lookup instead of an if/elif cascade
+        self._decision_table = self._build_decision_table()
+        
+        # Exact-match LRU cache for repeated tasks (retries, resubmits):
+        # (description, complexity_score) -> decision fields
+        self.decision_cache_max_entries = decision_cache_max_entries
+        self._decision_cache = OrderedDict()
     
     def route_task(self, task_analysis: TaskAnalysis) -> RoutingDecision:
         """Route task using simple pattern-based logic with improved confidence thresholds"""
         
+        total_requests = self.routing_stats['total_requests'] + 1
+        self.routing_stats['total_requests'] = total_requests
+        timed = self._timing_enabled and total_requests % self._timing_sample_rate == 0
+        if timed:
+            start_time = time.perf_counter()
+        
+        # Repeated tasks skip domain detection and the decision table entirely
+        cache_key = (task_analysis.description, task_analysis.complexity_score)
+        cached = self._decision_cache.get(cache_key)
+        if cached is not None:
+            self._decision_cache.move_to_end(cache_key)
+            routing_decision = self._decision_from_cache(cached)
+        else:
+            # Step 1: Analyze domains
+            domain_analysis = self.domain_detector.detect_domains(task_analysis.description)
+            
+            # Step 2: Apply routing decision logic
+            routing_decision = self._make_routing_decision(task_analysis, domain_analysis)
+            if task_analysis.description.strip():
+                self._cache_decision(cache_key, routing_decision)
+        
+        # Step 3: Update performance metrics (sampled requests only)
+        if timed:
+            analysis_time = (time.perf_counter() - start_time) * 1000
+            routing_decision.analysis_time_ms = analysis_time
+            self._update_stats(routing_decision, analysis_time)
+        
+        return routing_decision
+    
+    def route_tasks_batch(self, task_analyses: List[TaskAnalysis]) -> List[RoutingDecision]:
+        """Route a batch of tasks with one timing window shared across the batch
+        
+        Decisions match calling route_task on each task in order, decision cache hits
+        included; timed requests report the batch's mean per-task time.
+        """
+        
+        if not task_analyses:
+            return []
+        
         start_time = time.perf_counter()
-        self.routing_stats['total_requests'] += 1
+        first_request = self.routing_stats['total_requests'] + 1
+        self.routing_stats['total_requests'] += len(task_analyses)
         
-        # Step 1: Analyze domains
-        domain_analysis = self.domain_detector.detect_domains(task_analysis.description)
+        # Replay route_task's cache lookups and inserts in order so hits, misses and
+        # LRU evictions match routing the tasks one by one. New entries hold None
+        # until their task is routed below
+        decision_cache = self._decision_cache
+        cache_enabled = self.decision_cache_max_entries > 0
+        cache_keys = [(task_analysis.description, task_analysis.complexity_score)
+                      for task_analysis in task_analyses]
+        lookups = []
+        for cache_key in cache_keys:
+            if cache_key in decision_cache:
+                decision_cache.move_to_end(cache_key)
+                lookups.append((True, decision_cache[cache_key]))
+                continue
+            lookups.append((False, None))
+            if cache_enabled and cache_key[0].strip():
+                if len(decision_cache) >= self.decision_cache_max_entries:
+                    decision_cache.popitem(last=False)
+                decision_cache[cache_key] = None
         
-        # Step 2: Apply routing decision logic
-        routing_decision = self._make_routing_decision(task_analysis, domain_analysis)
+        # Domain detection runs once per distinct uncached description
+        miss_descriptions = list(dict.fromkeys(
+            cache_key[0] for cache_key, (hit, _) in zip(cache_keys, lookups) if not hit))
+        domain_analyses = dict(zip(miss_descriptions,
+                                   self.domain_detector.detect_domains_batch(miss_descriptions)))
         
-        # Step 3: Update performance metrics
-        analysis_time = (time.perf_counter() - start_time) * 1000
-        routing_decision.analysis_time_ms = analysis_time
-        self._update_stats(routing_decision, analysis_time)
+        decisions = []
+        routed_fields = {}
+        for task_analysis, cache_key, (hit, cached) in zip(task_analyses, cache_keys, lookups):
+            if hit:
+                routing_decision = self._decision_from_cache(
+                    cached if cached is not None else routed_fields[cache_key])
+            else:
+                routing_decision = self._make_routing_decision(
+                    task_analysis, domain_analyses[task_analysis.description])
+                if cache_key[0].strip():
+                    routed_fields[cache_key] = self._decision_fields(routing_decision)
+            decisions.append(routing_decision)
         
-        return routing_decision
+        for cache_key, fields in routed_fields.items():
+            if cache_key in decision_cache:
+                decision_cache[cache_key] = fields
+        
+        if not self._timing_enabled:
+            return decisions
+        
+        analysis_time = (time.perf_counter() - start_time) * 1000 / len(decisions)
+        timing_sample_rate = self._timing_sample_rate
+        for request_number, routing_decision in enumerate(decisions, first_request):
+            if request_number % timing_sample_rate == 0:
+                routing_decision.analysis_time_ms = analysis_time
+                self._update_stats(routing_decision, analysis_time)
+        
+        return decisions
+    
+    def _cache_decision(self, cache_key: Tuple[str, float], decision: RoutingDecision):
+        """Store the fields of a freshly routed decision; error decisions are never cached"""
+        
+        if self.decision_cache_max_entries <= 0:
+            return
+        if len(self._decision_cache) >= self.decision_cache_max_entries:
+            self._decision_cache.popitem(last=False)
+        self._decision_cache[cache_key] = self._decision_fields(decision)
+    
+    @staticmethod
+    def _decision_fields(decision: RoutingDecision) -> Tuple:
+        """Decision fields kept in the cache, in _decision_from_cache order"""
+        
+        return (decision.action, decision.selected_agent, decision.orchestration_type,
+                decision.confidence, decision.reasoning, decision.domain_count, decision.complexity_score)
+    
+    def _decision_from_cache(self, cached: Tuple) -> RoutingDecision:
+        """Rebuild a fresh decision from cached fields, counting it as that path was"""
+        
+        action, selected_agent, orchestration_type, confidence, reasoning, domain_count, complexity_score = cached
+        self.routing_stats[self._ACTION_STATS[action]] += 1
+        self.routing_stats['cache_hits'] += 1
+        return RoutingDecision(action, selected_agent, orchestration_type, confidence,
+                               reasoning, 0, True, complexity_score, domain_count)
     
     def _make_routing_decision(self, task_analysis: TaskAnalysis, domain_analysis: Dict) -> RoutingDecision:
         """Core routing logic with improved thresholds"""
         
-        domain_count = domain_analysis['domain_count']
-        domains = domain_analysis['domains']
-        complexity_score = task_analysis.complexity_score
-        
         # Input validation
         if not task_analysis.description.strip():
             return self._create_error_decision("Empty task description provided")
         
-        # Decision Path 1: No clear domain detected 
-        if domain_count == 0:
-            # For simple tasks with no clear domain, try direct routing to orchestrate-tasks
-            if complexity_score < 0.4:
-                self.routing_stats['direct_routes'] += 1
-                return RoutingDecision(
-                    action=RoutingAction.DIRECT_AGENT,
-                    selected_agent='@orchestrate-tasks',  # Safe default for simple tasks
-                    orchestration_type=None,
-                    confidence=0.5,
-                    reasoning="Simple task with no specific domain - routing to general task orchestrator",
-                    analysis_time_ms=0,
-                    domain_count=domain_count,
-                    complexity_score=complexity_score
-                )
-            else:
-                # Complex tasks with no clear domain should escalate
-                self.routing_stats['escalations'] += 1
-                return RoutingDecision(
-                    action=RoutingAction.ESCALATE,
-                    selected_agent=None,
-                    orchestration_type=None,
-                    confidence=0.3,
-                    reasoning="Complex task with no clear domain - requires strategic analysis by @agent-organizer",
-                    analysis_time_ms=0,
-                    domain_count=domain_count,
-                    complexity_score=complexity_score
-                )
-        
-        # Decision Path 2: Single domain with good confidence -> Direct routing
-        elif domain_count == 1 and domains[0]['confidence'] >= 0.6:
-            primary_domain = domains[0]
-            agent = self.agent_mappings.get(primary_domain['domain'], '@orchestrate-tasks')
-            
-            self.routing_stats['direct_routes'] += 1
-            return RoutingDecision(
-                action=RoutingAction.DIRECT_AGENT,
-                selected_agent=agent,
-                orchestration_type=None,
-                confidence=primary_domain['confidence'],
-                reasoning=f"High-confidence single domain ({primary_domain['domain']}) detected: {primary_domain['confidence']:.2f}",
-                analysis_time_ms=0,
-                domain_count=domain_count,
-                complexity_score=complexity_score
-            )
-        
-        # Decision Path 3: Single domain with lower confidence -> Consider complexity
-        elif domain_count == 1 and domains[0]['confidence'] >= 0.3:
-            primary_domain = domains[0]
-            
-            # For complex tasks even with single domain, use orchestration
-            if complexity_score >= 0.8:
-                orchestration_type = self._select_orchestration_type(domain_count, complexity_score)
-                self.routing_stats['orchestration_routes'] += 1
-                return RoutingDecision(
-                    action=RoutingAction.ORCHESTRATION,
-                    selected_agent=None,
-                    orchestration_type=orchestration_type,
-                    confidence=min(primary_domain['confidence'] * 0.9, 0.8),
-                    reasoning=f"Single domain ({primary_domain['domain']}) but high complexity ({complexity_score:.2f}) requires orchestration",
-                    analysis_time_ms=0,
-                    domain_count=domain_count,
-                    complexity_score=complexity_score
-                )
-            else:
-                # Medium confidence, low-medium complexity -> Direct route
-                agent = self.agent_mappings.get(primary_domain['domain'], '@orchestrate-tasks')
-                self.routing_stats['direct_routes'] += 1
-                return RoutingDecision(
-                    action=RoutingAction.DIRECT_AGENT,
-                    selected_agent=agent,
-                    orchestration_type=None,
-                    confidence=primary_domain['confidence'],
-                    reasoning=f"Medium-confidence single domain ({primary_domain['domain']}): {primary_domain['confidence']:.2f}",
-                    analysis_time_ms=0,
-                    domain_count=domain_count,
-                    complexity_score=complexity_score
-                )
-        
-        # Decision Path 4: Multiple domains -> Orchestration
-        elif domain_count >= 2:
-            orchestration_type = self._select_orchestration_type(domain_count, complexity_score)
-            average_confidence = sum(d['confidence'] for d in domains) / len(domains)
-            
-            self.routing_stats['orchestration_routes'] += 1
-            return RoutingDecision(
-                action=RoutingAction.ORCHESTRATION,
-                selected_agent=None,
-                orchestration_type=orchestration_type,
-                confidence=min(average_confidence, 0.85),
-                reasoning=f"Multiple domains ({domain_count}) require coordination: {[d['domain'] for d in domains[:3]]}",
-                analysis_time_ms=0,
-                domain_count=domain_count,
-                complexity_score=complexity_score
-            )
+        domain_count = domain_analysis['domain_count']
+        complexity_score = task_analysis.complexity_score
         
-        # Decision Path 5: Very low confidence -> Use orchestrate-tasks as safe default
+        # Bucket the three inputs once; primary-domain confidence only matters
+        # for single-domain tasks
+        if domain_count == 1:
+            confidence = domain_analysis['domains'][0]['confidence']
+            confidence_bucket = 'high' if confidence >= 0.6 else ('med' if confidence >= 0.3 else 'low')
         else:
-            self.routing_stats['direct_routes'] += 1
-            return RoutingDecision(
-                action=RoutingAction.DIRECT_AGENT,
-                selected_agent='@orchestrate-tasks',  # Safe default
-                orchestration_type=None,
-                confidence=0.4,
-                reasoning=f"Low domain confidence - using general task orchestrator as safe default",
-                analysis_time_ms=0,
-                domain_count=domain_count,
-                complexity_score=complexity_score
+            confidence_bucket = None
+        complexity_bucket = 'hi' if complexity_score >= 0.8 else ('mid' if complexity_score >= 0.4 else 'lo')
+        
+        route = self._decision_table[(min(domain_count, 2), confidence_bucket, complexity_bucket)]
+        return route(domain_analysis, domain_count, complexity_score)
+    
+    def _build_decision_table(self) -> Dict[Tuple[int, Optional[str], str], Callable]:
+        """Map (domain count bucket, confidence bucket, complexity bucket) to a decision path"""
+        
+        table = {}
+        for complexity_bucket in ('lo', 'mid', 'hi'):
+            # Decision Path 1: No clear domain detected
+            table[(0, None, complexity_bucket)] = (
+                self._route_general_task if complexity_bucket == 'lo' else self._route_unknown_domain
             )
+            # Decision Path 2: Single domain with good confidence -> Direct routing
+            table[(1, 'high', complexity_bucket)] = self._route_high_confidence_domain
+            # Decision Path 3: Single domain with lower confidence -> Consider complexity
+            table[(1, 'med', complexity_bucket)] = (
+                self._route_complex_single_domain if complexity_bucket == 'hi'
+                else self._route_medium_confidence_domain
+            )
+            # Decision Path 5: Very low confidence -> Use orchestrate-tasks as safe default
+            table[(1, 'low', complexity_bucket)] = self._route_low_confidence
+            # Decision Path 4: Multiple domains -> Orchestration
+            table[(2, None, complexity_bucket)] = self._route_multi_domain
+        return table
+    
+    def _route_general_task(self, domain_analysis: Dict, domain_count: int, complexity_score: float) -> RoutingDecision:
+        """Simple task with no clear domain - route to the general task orchestrator"""
+        
+        self.routing_stats['direct_routes'] += 1
+        return self._decision(
+            RoutingAction.DIRECT_AGENT,
+            AGENT_ORCH_TASKS,  # Safe default for simple tasks
+            None,
+            0.5,
+            "Simple task with no specific domain - routing to general task orchestrator",
+            domain_count, complexity_score
+        )
+    
+    def _route_unknown_domain(self, domain_analysis: Dict, domain_count: int, complexity_score: float) -> RoutingDecision:
+        """Complex tasks with no clear domain should escalate"""
+        
+        self.routing_stats['escalations'] += 1
+        return self._decision(
+            RoutingAction.ESCALATE,
+            None,
+            None,
+            0.3,
+            "Complex task with no clear domain - requires strategic analysis by @agent-organizer",
+            domain_count, complexity_score
+        )
+    
+    def _route_high_confidence_domain(self, domain_analysis: Dict, domain_count: int, complexity_score: float) -> RoutingDecision:
+        """Single domain with good confidence - route directly to its agent"""
+        
+        primary_domain = domain_analysis['domains'][0]
+        agent = self.agent_mappings.get(primary_domain['domain'], AGENT_ORCH_TASKS)
+        
+        self.routing_stats['direct_routes'] += 1
+        return self._decision(
+            RoutingAction.DIRECT_AGENT,
+            agent,
+            None,
+            primary_domain['confidence'],
+            f"High-confidence single domain ({primary_domain['domain']}) detected: {primary_domain['confidence']:.2f}",
+            domain_count, complexity_score
+        )
+    
+    def _route_complex_single_domain(self, domain_analysis: Dict, domain_count: int, complexity_score: float) -> RoutingDecision:
+        """For complex tasks even with single domain, use orchestration"""
+        
+        primary_domain = domain_analysis['domains'][0]
+        orchestration_type = self._select_orchestration_type(domain_count, complexity_score)
+        
+        self.routing_stats['orchestration_routes'] += 1
+        return self._decision(
+            RoutingAction.ORCHESTRATION,
+            None,
+            orchestration_type,
+            min(primary_domain['confidence'] * 0.9, 0.8),
+            f"Single domain ({primary_domain['domain']}) but high complexity ({complexity_score:.2f}) requires orchestration",
+            domain_count, complexity_score
+        )
+    
+    def _route_medium_confidence_domain(self, domain_analysis: Dict, domain_count: int, complexity_score: float) -> RoutingDecision:
+        """Medium confidence, low-medium complexity - route directly"""
+        
+        primary_domain = domain_analysis['domains'][0]
+        agent = self.agent_mappings.get(primary_domain['domain'], AGENT_ORCH_TASKS)
+        
+        self.routing_stats['direct_routes'] += 1
+        return self._decision(
+            RoutingAction.DIRECT_AGENT,
+            agent,
+            None,
+            primary_domain['confidence'],
+            f"Medium-confidence single domain ({primary_domain['domain']}): {primary_domain['confidence']:.2f}",
+            domain_count, complexity_score
+        )
+    
+    def _route_multi_domain(self, domain_analysis: Dict, domain_count: int, complexity_score: float) -> RoutingDecision:
+        """Multiple domains require orchestration"""
+        
+        orchestration_type = self._select_orchestration_type(domain_count, complexity_score)
+        average_confidence = domain_analysis['avg_confidence']
+        
+        self.routing_stats['orchestration_routes'] += 1
+        return self._decision(
+            RoutingAction.ORCHESTRATION,
+            None,
+            orchestration_type,
+            min(average_confidence, 0.85),
+            f"Multiple domains ({domain_count}) require coordination: {domain_analysis['top_domain_names']}",
+            domain_count, complexity_score
+        )
+    
+    def _route_low_confidence(self, domain_analysis: Dict, domain_count: int, complexity_score: float) -> RoutingDecision:
+        """Low domain confidence - use orchestrate-tasks as safe default"""
+        
+        self.routing_stats['direct_routes'] += 1
+        return self._decision(
+            RoutingAction.DIRECT_AGENT,
+            AGENT_ORCH_TASKS,  # Safe default
+            None,
+            0.4,
+            f"Low domain confidence - using general task orchestrator as safe default",
+            domain_count, complexity_score
+        )
+    
+    @staticmethod
+    def _decision(action: RoutingAction, selected_agent: Optional[str],
+                  orchestration_type: Optional[str], confidence: float, reasoning: str,
+                  domain_count: int, complexity_score: float) -> RoutingDecision:
+        """Build a decision path result; timing is filled in by route_task"""
+        
+        return RoutingDecision(action, selected_agent, orchestration_type, confidence,
+                               reasoning, 0, False, complexity_score, domain_count)
     
     def _select_orchestration_type(self, domain_count: int, complexity_score: float) -> str:
         """Select appropriate orchestration system based on complexity and domain count"""
         
-        # Priority: complexity > domain count
-        if complexity_score >= 0.8 or domain_count >= 4:
-            return '@orchestrate-agents-adv'
-        elif domain_count >= 2 or complexity_score >= 0.5:
-            return '@orchestrate-agents'
-        else:
-            return '@orchestrate-tasks'
+        # Priority: complexity > domain count. The advanced condition implies the
+        # standard one, so the number of conditions met indexes the tier directly
+        tier = ((complexity_score >= 0.8 or domain_count >= 4) +
+                (domain_count >= 2 or complexity_score >= 0.5))
+        return self._ORCHESTRATION_TIERS[tier]
     
     def _create_error_decision(self, error_message: str) -> RoutingDecision:
         """Create a fallback routing decision for error cases"""
         
         return RoutingDecision(
             action=RoutingAction.DIRECT_AGENT,  # Changed from ESCALATE to safer direct routing
-            selected_agent='@orchestrate-tasks',  # Safe fallback
+            selected_agent=AGENT_ORCH_TASKS,  # Safe fallback
             orchestration_type=None,
             confidence=0.3,
             reasoning=f"Error in routing: {error_message}",
@@ -202,28 +377,47 @@ class BasicRoutingEngine:
     def _update_stats(self, decision: RoutingDecision, analysis_time_ms: float):
         """Update routing performance statistics"""
         
-        # Update rolling average response time
-        current_avg = self.routing_stats['avg_response_time_ms']
-        total_requests = self.routing_stats['total_requests']
-        
-        new_avg = ((current_avg * (total_requests - 1)) + analysis_time_ms) / total_requests
-        self.routing_stats['avg_response_time_ms'] = new_avg
+        self._response_time_sum_ms += analysis_time_ms
+        self._timed_requests += 1
     
     def get_routing_stats(self) -> Dict:
         """Get current routing performance statistics"""
         
-        total = self.routing_stats['total_requests']
-        if total == 0:
-            return self.routing_stats.copy()
+        # One dict literal per scrape instead of copy() + update()
+        routing_stats = self.routing_stats
+        total = routing_stats['total_requests']
+        direct_routes = routing_stats['direct_routes']
+        orchestration_routes = routing_stats['orchestration_routes']
+        escalations = routing_stats['escalations']
+        cache_hits = routing_stats['cache_hits']
+        timed_requests = self._timed_requests
+        avg_response_time_ms = self._response_time_sum_ms / timed_requests if timed_requests else 0
         
-        stats = self.routing_stats.copy()
-        stats.update({
-            'direct_route_percentage': (self.routing_stats['direct_routes'] / total) * 100,
-            'orchestration_percentage': (self.routing_stats['orchestration_routes'] / total) * 100,
-            'escalation_percentage': (self.routing_stats['escalations'] / total) * 100
-        })
+        if total == 0:
+            return {
+                'total_requests': total,
+                'direct_routes': direct_routes,
+                'orchestration_routes': orchestration_routes,
+                'escalations': escalations,
+                'cache_hits': cache_hits,
+                'avg_response_time_ms': avg_response_time_ms
+            }
         
-        return stats
+        return {
+            'total_requests': total,
+            'direct_routes': direct_routes,
+            'orchestration_routes': orchestration_routes,
+            'escalations': escalations,
+            'cache_hits': cache_hits,
+            'avg_response_time_ms': avg_response_time_ms,
+            'cache_hit_rate': cache_hits / total,
+            'direct_route_percentage': (direct_routes / total) * 100,
+            'orchestration_percentage': (orchestration_routes / total) * 100,
+            'escalation_percentage': (escalations / total) * 100
+        }
+
+# Potentially unsafe content, matched case-insensitively in a single scan
+_SUSPICIOUS_RE = re.compile(r'eval\(|exec\(|__import__|subprocess', re.IGNORECASE)
 
 class RoutingValidator:
     """Input validation and error handling for routing requests"""
@@ -242,8 +436,7 @@ class RoutingValidator:
             return False, "Task description too long (max 2000 characters)"
         
         # Check for potential security issues
-        suspicious_patterns = ['eval(', 'exec(', '__import__', 'subprocess']
-        if any(pattern in description.lower() for pattern in suspicious_patterns):
+        if _SUSPICIOUS_RE.search(description):
             return False, "Task description contains potentially unsafe content"
         
         return True, "Valid"
@@ -259,4 +452,30 @@ class RoutingValidator:
         description = description.strip()
         description = ' '.join(description.split())  # Normalize whitespace
         
-        return description
\ No newline at end of file
+        return description
+    
+    @staticmethod
+    def validate_and_sanitize(description: str) -> tuple[bool, str, str]:
+        """Validate and sanitize task description in one pass
+        
+        Equivalent to validate_task_description followed by sanitize_input,
+        but splits the string once and reuses the result for both steps.
+        """
+        
+        if not isinstance(description, str):
+            return False, "Task description must be a string", ""
+        
+        # split() strips and normalizes whitespace in the same scan
+        clean_description = ' '.join(description.split())
+        
+        if not clean_description:
+            return False, "Task description cannot be empty", ""
+        
+        if len(description) > 2000:  # Reasonable limit
+            return False, "Task description too long (max 2000 characters)", ""
+        
+        # Suspicious patterns contain no whitespace, so the clean text is equivalent
+        if _SUSPICIOUS_RE.search(clean_description):
+            return False, "Task description contains potentially unsafe content", ""
+        
+        return True, "Valid", clean_description
@@ -13,13 +13,16 @@ from rich.columns import Columns
 
 console = Console()
 
+# Demo commands run from the repository root
+DEMO_DIR = Path(__file__).parent
+
 def run_command(cmd, description):
     """Run a command and display the results."""
     console.print(f"\n🚀 {description}", style="bold blue")
     console.print(f"Command: [cyan]{' '.join(cmd)}[/cyan]")
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=Path(__file__).parent)
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=DEMO_DIR)
         if result.stdout:
             console.print("Output:", style="green")
             console.print(result.stdout)
@@ -11,6 +11,10 @@ import sys
 import yaml
 import json
 import time
+import copy
+import heapq
+import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
@@ -36,12 +40,72 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
+# Parsed configurations: resolved path -> (mtime_ns, size, config), in LRU order.
+# Every orchestrator instance reuses the parse until the file changes on disk
+_CONFIG_CACHE = OrderedDict()
+_CONFIG_CACHE_MAX_ENTRIES = 100
+
+
+def _config_sidecar_path(config_path: Path) -> Path:
+    """JSON cache written next to a YAML config (refresh_schedules.cache.json)"""
+    return config_path.with_suffix('.cache.json')
+
+
+def _read_config_sidecar(config_path: Path, stat: os.stat_result) -> Optional[Dict]:
+    """Return the config from its JSON sidecar if it was written from this exact YAML file"""
+    try:
+        with open(_config_sidecar_path(config_path), 'r') as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if (not isinstance(sidecar, dict) or sidecar.get('source_mtime_ns') != stat.st_mtime_ns
+            or sidecar.get('source_size') != stat.st_size):
+        return None
+    return sidecar.get('config')
+
+
+def _write_config_sidecar(config_path: Path, stat: os.stat_result, config: Dict) -> None:
+    """Atomically write the parsed config as JSON so later processes skip YAML parsing"""
+    # Only configs that survive a JSON round trip unchanged are cached; YAML dates,
+    # non-string keys and the like keep being parsed from YAML
+    try:
+        payload = json.dumps(config)
+        if json.loads(payload) != config:
+            return
+    except (TypeError, ValueError):
+        return
+    
+    sidecar_path = _config_sidecar_path(config_path)
+    tmp_path = sidecar_path.with_name(f"{sidecar_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(f'{{"source_mtime_ns": {stat.st_mtime_ns}, "source_size": {stat.st_size}, '
+                    f'"config": {payload}}}')
+        os.replace(tmp_path, sidecar_path)
+    except OSError as e:
+        # A read-only config directory just means no sidecar
+        logger.debug(f"Could not write configuration cache {sidecar_path}: {str(e)}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
 class KnowledgeRefreshOrchestrator:
     """
     Main orchestrator for automated knowledge refresh cycles with performance optimization.
     Coordinates BRAINPOD components, scheduling, monitoring, and performance optimization.
     """
     
+    # Active-job monitoring and performance health checks still run at least this often
+    HEALTH_CHECK_INTERVAL_SECONDS = 30
+    
     def __init__(self, config_path: str = None):
         """Initialize the orchestrator with configuration"""
         self.config = self._load_configuration(config_path)
@@ -56,6 +120,17 @@ class KnowledgeRefreshOrchestrator:
         self.scheduled_jobs = {}
         self.active_jobs = {}
         
+        # Min-heap of (next_run epoch seconds, job_id) over scheduled_jobs; entries whose
+        # job has since started or been rescheduled are skipped when popped
+        self._job_heap = []
+        # Wakes the orchestration loop when a job is scheduled or finishes; created in
+        # start() so it belongs to the running event loop
+        self._scheduler_wake = None
+        
+        # Shared aiohttp session for webhook alerts, opened on first use so repeated
+        # alerts reuse pooled connections and cached DNS lookups
+        self._http_session = None
+        
         logger.info("KnowledgeRefreshOrchestrator initialized with performance optimization")
 
     def _load_configuration(self, config_path: str = None) -> Dict:
@@ -64,8 +139,28 @@ class KnowledgeRefreshOrchestrator:
             config_path = Path(__file__).parent / "config" / "refresh_schedules.yaml"
         
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config_path = Path(config_path)
+            stat = config_path.stat()
+            cache_key = str(config_path.resolve())
+            
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                _CONFIG_CACHE.move_to_end(cache_key)
+                logger.info(f"Configuration loaded from {config_path} (cached)")
+                # Callers get their own copy, so the cached parse is never mutated
+                return copy.deepcopy(cached[2])
+            
+            # Prefer the JSON sidecar; parse the YAML (and refresh the sidecar) otherwise
+            config = _read_config_sidecar(config_path, stat)
+            if config is None:
+                with open(config_path, 'r') as f:
+                    config = yaml.load(f, Loader=_YamlSafeLoader)
+                _write_config_sidecar(config_path, stat, config)
+            
+            _CONFIG_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(config))
+            _CONFIG_CACHE.move_to_end(cache_key)
+            if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX_ENTRIES:
+                _CONFIG_CACHE.popitem(last=False)
             
             logger.info(f"Configuration loaded from {config_path}")
             return config
@@ -89,6 +184,8 @@ class KnowledgeRefreshOrchestrator:
             # Setup signal handlers for graceful shutdown
             self._setup_signal_handlers()
             
+            self._scheduler_wake = asyncio.Event()
+            
             # Initialize performance optimization and monitoring
             await self._initialize_performance_optimization()
             
@@ -104,6 +201,25 @@ class KnowledgeRefreshOrchestrator:
         except Exception as e:
             logger.error(f"Orchestrator startup failed: {str(e)}")
             raise
+        
+        finally:
+            await self._close_http_session()
+
+    async def _get_http_session(self):
+        """Return the shared webhook HTTP session, creating it on first use"""
+        if self._http_session is None or self._http_session.closed:
+            import aiohttp
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._http_session
+
+    async def _close_http_session(self) -> None:
+        """Close the shared webhook HTTP session if one was opened"""
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
 
     async def _initialize_performance_optimization(self) -> None:
         """Initialize performance optimization system"""
@@ -180,9 +296,10 @@ class KnowledgeRefreshOrchestrator:
             
             if webhook_url and alert_data['severity'] in ['error', 'critical']:
                 try:
-                    import aiohttp
-                    async with aiohttp.ClientSession() as session:
-                        await session.post(webhook_url, json=alert_data, timeout=10)
+                    session = await self._get_http_session()
+                    # Release the response so its connection returns to the pool
+                    async with session.post(webhook_url, json=alert_data):
+                        pass
                     logger.info(f"Alert sent to webhook: {alert_data['alert_id']}")
                 except Exception as e:
                     logger.error(f"Failed to send webhook alert: {str(e)}")
@@ -215,7 +332,7 @@ class KnowledgeRefreshOrchestrator:
                 job.next_run = self._calculate_next_run_time(job)
                 
                 # Store scheduled job
-                self.scheduled_jobs[job.job_id] = job
+                self._schedule_job(job)
                 
                 logger.info(f"Scheduled {agent_id} for {job.schedule} refresh (next: {job.next_run})")
                 
@@ -237,29 +354,52 @@ class KnowledgeRefreshOrchestrator:
                 # Performance health check
                 await self._performance_health_check()
                 
-                # Wait before next cycle
-                await asyncio.sleep(30)  # Check every 30 seconds
+                # Sleep until the earliest job is due (when a slot is free), a job is
+                # scheduled or finishes, or the next health check is due. Nothing awaits
+                # between clear() and wait(), so no wake-up is lost
+                self._scheduler_wake.clear()
+                delay = self.HEALTH_CHECK_INTERVAL_SECONDS
+                if self._job_heap and len(self.active_jobs) < self._max_concurrent_refreshes():
+                    delay = min(delay, max(0.0, self._job_heap[0][0] - time.time()))
+                try:
+                    await asyncio.wait_for(self._scheduler_wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
                 
             except Exception as e:
                 logger.error(f"Error in orchestration loop: {str(e)}")
                 await asyncio.sleep(60)  # Wait longer on error
 
+    def _max_concurrent_refreshes(self) -> int:
+        """Configured limit on simultaneously running refresh jobs"""
+        return self.config.get('global_settings', {}).get('scheduling', {}).get('max_concurrent_refreshes', 2)
+
+    def _schedule_job(self, job: RefreshJob) -> None:
+        """Add a job to the schedule and wake the orchestration loop"""
+        self.scheduled_jobs[job.job_id] = job
+        if job.next_run:
+            heapq.heappush(self._job_heap, (job.next_run.timestamp(), job.job_id))
+        if self._scheduler_wake is not None:
+            self._scheduler_wake.set()
+
     async def _check_scheduled_jobs(self) -> None:
-        """Check for scheduled jobs ready to run"""
-        current_time = datetime.now()
-        max_concurrent = self.config.get('global_settings', {}).get('scheduling', {}).get('max_concurrent_refreshes', 2)
+        """Start due scheduled jobs, earliest first, up to the concurrency limit"""
+        current_timestamp = time.time()
+        max_concurrent = self._max_concurrent_refreshes()
+        job_heap = self._job_heap
         
         # Count active jobs
         active_count = len(self.active_jobs)
         
-        for job_id, job in list(self.scheduled_jobs.items()):
-            if active_count >= max_concurrent:
-                break
-                
-            if job.next_run and job.next_run <= current_time:
-                # Start job
-                await self._start_refresh_job(job)
-                active_count += 1
+        while job_heap and active_count < max_concurrent and job_heap[0][0] <= current_timestamp:
+            next_run_timestamp, job_id = heapq.heappop(job_heap)
+            job = self.scheduled_jobs.get(job_id)
+            if job is None or not job.next_run or job.next_run.timestamp() != next_run_timestamp:
+                continue  # Stale entry: job already started or rescheduled
+            
+            # Start job
+            await self._start_refresh_job(job)
+            active_count += 1
 
     async def _start_refresh_job(self, job: RefreshJob) -> None:
         """Start a knowledge refresh job with performance monitoring"""
@@ -313,7 +453,7 @@ class KnowledgeRefreshOrchestrator:
             job.next_run = self._calculate_next_run_time(job)
             
             # Move back to scheduled jobs
-            self.scheduled_jobs[job.job_id] = job
+            self._schedule_job(job)
             
         except Exception as e:
             logger.error(f"Error executing refresh job {job.job_id}: {str(e)}")
@@ -325,6 +465,10 @@ class KnowledgeRefreshOrchestrator:
             if job.job_id in self.active_jobs:
                 del self.active_jobs[job.job_id]
             
+            # A concurrency slot is free again
+            if self._scheduler_wake is not None:
+                self._scheduler_wake.set()
+            
             # Record metrics
             duration = time.time() - start_time
             await self.monitor.record_job_completion(job, duration)
@@ -11,6 +11,7 @@ from src.core.classifier import HierarchicalClassifier
 from src.core.models import ComplexityLevel, RoutingAction
 from src.analysis.domain_detector import DomainDetectionEngine
 from src.routing.router import BasicRoutingEngine, RoutingValidator
+from src.monitoring.performance_monitor import PerformanceMonitor
 
 class TestPhase1CoreFunctionality(unittest.TestCase):
     """Test core Phase 1 functionality and requirements"""
@@ -50,6 +51,49 @@ class TestPhase1CoreFunctionality(unittest.TestCase):
             self.assertGreater(result.estimated_tokens, 0)
             self.assertGreater(result.estimated_time_minutes, 0)
     
+    def test_classification_cache(self):
+        """Test repeated descriptions are served from the classification cache"""
+
+        description = "implement user authentication API"
+        first = self.classifier.classify_task(description)
+        second = self.classifier.classify_task(description)
+
+        self.assertFalse(first.cache_hit)
+        self.assertTrue(second.cache_hit)
+        self.assertEqual(first.complexity_score, second.complexity_score)
+        self.assertEqual(first.complexity_level, second.complexity_level)
+        self.assertEqual(first.estimated_tokens, second.estimated_tokens)
+        self.assertEqual(first.estimated_time_minutes, second.estimated_time_minutes)
+
+        # Oldest entry is evicted once the cache is full
+        small_classifier = HierarchicalClassifier(cache_max_entries=2)
+        for task in ("check status", "build api", "deploy app"):
+            small_classifier.classify_task(task)
+        self.assertFalse(small_classifier.classify_task("check status").cache_hit)
+        self.assertTrue(small_classifier.classify_task("deploy app").cache_hit)
+
+        # A zero-size cache disables caching instead of failing
+        uncached_classifier = HierarchicalClassifier(cache_max_entries=0)
+        uncached_classifier.classify_task("check status")
+        self.assertFalse(uncached_classifier.classify_task("check status").cache_hit)
+
+    def test_budget_overrun_result_not_cached(self):
+        """Test coarse results forced by an overrun detailed-analysis budget are not cached"""
+
+        classifier = HierarchicalClassifier()
+        classifier._DETAILED_BUDGET_NS = 0
+        description = "implement user authentication API"
+        classifier.classify_task(description)
+        self.assertFalse(classifier.classify_task(description).cache_hit)
+
+        # Once the budget allows detailed analysis the result is cached as usual
+        del classifier._DETAILED_BUDGET_NS
+        detailed = classifier.classify_task(description)
+        self.assertFalse(detailed.cache_hit)
+        self.assertTrue(classifier.classify_task(description).cache_hit)
+        self.assertEqual(detailed.complexity_score,
+                         HierarchicalClassifier().classify_task(description).complexity_score)
+
     def test_simple_task_classification(self):
         """Test classification of simple tasks"""
         
@@ -141,6 +185,26 @@ class TestPhase1CoreFunctionality(unittest.TestCase):
             self.assertGreaterEqual(primary_confidence, case['min_confidence'],
                                   f"Confidence {primary_confidence} below minimum {case['min_confidence']}")
     
+    def test_batch_domain_detection_matches_individual(self):
+        """Test batch domain detection returns the same analyses as per-task detection"""
+        
+        descriptions = [
+            'create a React component with responsive styling',
+            'deploy application to AWS with Docker',
+            'security audit for authentication vulnerabilities',
+            'hello world'
+        ]
+        
+        batched = self.domain_detector.detect_domains_batch(descriptions)
+        
+        self.assertEqual(len(batched), len(descriptions))
+        for description, batch_result in zip(descriptions, batched):
+            single_result = self.domain_detector.detect_domains(description)
+            for key in ('domains', 'domain_count', 'total_confidence', 'primary_domain', 'task_lower'):
+                self.assertEqual(batch_result[key], single_result[key])
+            self.assertGreaterEqual(batch_result['analysis_time_ms'], 0)
+        self.assertEqual(self.domain_detector.detect_domains_batch([]), [])
+    
     def test_routing_decision_logic(self):
         """Test routing decision logic with various scenarios"""
         
@@ -178,6 +242,69 @@ class TestPhase1CoreFunctionality(unittest.TestCase):
             self.assertIsNotNone(decision.reasoning,
                                f"No reasoning provided for '{case['description']}'")
     
+    def test_routing_decision_cache(self):
+        """Test repeated tasks are served from the decision cache with identical results"""
+        
+        task_analysis = self.classifier.classify_task('Create React component with authentication API')
+        first = self.router.route_task(task_analysis)
+        second = self.router.route_task(task_analysis)
+        
+        self.assertFalse(first.cache_hit)
+        self.assertTrue(second.cache_hit)
+        self.assertIsNot(first, second)
+        for field in ('action', 'selected_agent', 'orchestration_type', 'confidence',
+                      'reasoning', 'domain_count', 'complexity_score'):
+            self.assertEqual(getattr(first, field), getattr(second, field))
+        
+        stats = self.router.get_routing_stats()
+        self.assertEqual(stats['total_requests'], 2)
+        self.assertEqual(stats['cache_hits'], 1)
+        self.assertEqual(stats['cache_hit_rate'], 0.5)
+        self.assertEqual(stats['direct_routes'] + stats['orchestration_routes'] + stats['escalations'], 2)
+        
+        # A zero-size cache disables decision caching instead of failing
+        uncached_router = BasicRoutingEngine(decision_cache_max_entries=0)
+        uncached_router.route_task(task_analysis)
+        self.assertFalse(uncached_router.route_task(task_analysis).cache_hit)
+    
+    def test_batch_routing_matches_individual(self):
+        """Test batch routing produces the same decisions and counters as per-task routing"""
+        
+        descriptions = [
+            'check deployment status',
+            'Create React component with authentication API',
+            'comprehensive enterprise architecture modernization',
+            'write documentation readme guide for the api',
+            'hello world',
+            'Create React component with authentication API',
+            ''
+        ]
+        task_analyses = [self.classifier.classify_task(d) for d in descriptions]
+        
+        batch_router = BasicRoutingEngine()
+        batched = batch_router.route_tasks_batch(task_analyses)
+        individual = [self.router.route_task(task_analysis) for task_analysis in task_analyses]
+        
+        self.assertEqual(len(batched), len(individual))
+        for batch_decision, single_decision in zip(batched, individual):
+            self.assertEqual(batch_decision.action, single_decision.action)
+            self.assertEqual(batch_decision.selected_agent, single_decision.selected_agent)
+            self.assertEqual(batch_decision.orchestration_type, single_decision.orchestration_type)
+            self.assertEqual(batch_decision.confidence, single_decision.confidence)
+            self.assertEqual(batch_decision.cache_hit, single_decision.cache_hit)
+            self.assertGreaterEqual(batch_decision.analysis_time_ms, 0)
+        
+        # Repeats are served from the decision cache across batches too
+        self.assertTrue(all(decision.cache_hit for decision in batch_router.route_tasks_batch(task_analyses[:5])))
+        for task_analysis in task_analyses[:5]:
+            self.router.route_task(task_analysis)
+        
+        batch_stats = batch_router.get_routing_stats()
+        single_stats = self.router.get_routing_stats()
+        for key in ('total_requests', 'direct_routes', 'orchestration_routes', 'escalations', 'cache_hits'):
+            self.assertEqual(batch_stats[key], single_stats[key])
+        self.assertEqual(batch_router.route_tasks_batch([]), [])
+    
     def test_input_validation(self):
         """Test input validation and error handling"""
         
@@ -206,7 +333,28 @@ class TestPhase1CoreFunctionality(unittest.TestCase):
             is_valid, message = self.validator.validate_task_description(invalid_input)
             self.assertFalse(is_valid, f"Invalid input accepted: {invalid_input}")
             self.assertIn(expected_error.lower(), message.lower())
-    
+
+    def test_combined_validation_matches_two_pass(self):
+        """Test single-pass validate_and_sanitize agrees with validate + sanitize"""
+
+        inputs = [
+            "  create   a React\tcomponent  ",
+            "",
+            "   ",
+            "x" * 2001,
+            "please EXEC( this",
+            "run a Subprocess",
+            123
+        ]
+
+        for task_input in inputs:
+            is_valid, message, clean = self.validator.validate_and_sanitize(task_input)
+            expected_valid, expected_message = self.validator.validate_task_description(task_input)
+            self.assertEqual(is_valid, expected_valid, f"Mismatch for: {task_input!r}")
+            self.assertEqual(message, expected_message)
+            if is_valid:
+                self.assertEqual(clean, self.validator.sanitize_input(task_input))
+
     def test_end_to_end_routing_performance(self):
         """Test end-to-end routing performance targets"""
         
@@ -278,6 +426,73 @@ class TestPhase1CoreFunctionality(unittest.TestCase):
             self.assertGreater(stats['total_requests'], 0)
             self.assertGreaterEqual(stats['success_rate'], 0.8)
             self.assertGreaterEqual(stats['current_avg_response_time_ms'], 0)
+
+    def test_batch_recording_matches_individual(self):
+        """Test batch metric recording produces the same report as per-decision recording"""
+
+        decisions = [
+            {'analysis_time_ms': 12.0, 'action': RoutingAction.DIRECT_AGENT, 'confidence': 0.9,
+             'cache_hit': True, 'complexity_score': 0.2, 'domain_count': 1},
+            {'analysis_time_ms': 80.0, 'action': RoutingAction.ORCHESTRATION, 'confidence': 0.7,
+             'cache_hit': False, 'complexity_score': 0.5, 'domain_count': 2},
+            {'analysis_time_ms': 250.0, 'action': RoutingAction.ESCALATE, 'confidence': 0.4,
+             'cache_hit': False, 'complexity_score': 0.9, 'domain_count': 0}
+        ]
+        successes = [True, True, False]
+
+        individual = PerformanceMonitor()
+        for decision, success in zip(decisions, successes):
+            individual.record_routing_decision(decision, success)
+        batched = PerformanceMonitor()
+        batched.record_routing_decision_batch(decisions, successes)
+
+        self.assertEqual(batched.total_requests, 3)
+        self.assertEqual(len(batched.golden_signals_history), 1)
+        individual_report = individual.generate_performance_report()
+        batched_report = batched.generate_performance_report()
+        for section in ('performance_summary', 'success_analysis', 'complexity_analysis'):
+            self.assertEqual(individual_report[section], batched_report[section])
+
+        with self.assertRaises(ValueError):
+            batched.record_routing_decision_batch(decisions, [True])
+    
+    def test_zero_history_monitor_records_without_retaining(self):
+        """Test a monitor with max_history=0 counts requests but retains no metrics"""
+        
+        monitor = PerformanceMonitor(max_history=0)
+        for _ in range(3):
+            monitor.record_routing_decision({'analysis_time_ms': 12.0, 'action': RoutingAction.DIRECT_AGENT,
+                                             'confidence': 0.9, 'complexity_score': 0.2, 'domain_count': 1})
+        
+        self.assertEqual(monitor.total_requests, 3)
+        self.assertEqual(monitor.get_real_time_stats(), {'status': 'no_data'})
+    
+    def test_golden_signals_reports_are_independent(self):
+        """Test callers mutating a golden signals report do not affect later reports"""
+        
+        monitor = PerformanceMonitor()
+        monitor.record_routing_decision({'analysis_time_ms': 12.0, 'action': RoutingAction.DIRECT_AGENT,
+                                         'confidence': 0.9, 'complexity_score': 0.2, 'domain_count': 1})
+        
+        first = monitor.get_sre_golden_signals()
+        first['golden_signals']['latency']['trend'] = 'mutated'
+        first['golden_signals'].clear()
+        first['production_issue_detection']['monitoring_coverage'].clear()
+        
+        second = monitor.get_sre_golden_signals()
+        self.assertEqual(second['golden_signals']['latency']['trend'], 'stable')
+        self.assertIn('traffic', second['golden_signals'])
+        self.assertTrue(second['production_issue_detection']['monitoring_coverage']['golden_signals_active'])
+    
+    def test_escalation_rate_tracks_escalations(self):
+        """Test escalated routing decisions move the escalation rate"""
+        
+        decision = self.system.route_task(
+            "Design enterprise-wide microservices architecture migration strategy for the whole organization platform"
+        )
+        
+        self.assertEqual(decision.action, RoutingAction.ESCALATE)
+        self.assertGreater(self.system.monitor.service_metrics['escalation_rate'], 0)
     
     def test_system_health_check(self):
         """Test system health monitoring"""